@@ -8,6 +8,7 @@ Usage:
     python mcp_server.py                    # Run with stdio transport (for Claude Desktop)
     python mcp_server.py --transport sse    # Run with SSE transport
     python mcp_server.py --port 5173        # Custom port for SSE
+    python mcp_server.py --no-cache         # Always query APIs for DOI metadata
 """
 
 import os
@@ -20,6 +21,7 @@ from dotenv import load_dotenv
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.mcp.server import create_mcp_server
+from src.utils.api_cache import get_api_cache
 from src.config.mcp_config import (
     MCP_SERVER_NAME,
     MCP_SERVER_VERSION,
@@ -63,6 +65,11 @@ def main():
         action="store_true",
         help="Enable debug logging"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the DOI metadata cache"
+    )
 
     args = parser.parse_args()
 
@@ -71,6 +78,9 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
         logger.setLevel(logging.DEBUG)
 
+    if args.no_cache:
+        get_api_cache().enabled = False
+
     logger.info("=" * 70)
     logger.info(f"🚀 Starting {MCP_SERVER_NAME} MCP Server v{MCP_SERVER_VERSION}")
     logger.info("=" * 70)
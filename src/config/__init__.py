@@ -6,8 +6,17 @@ from .settings import (
     MAX_LOG_BUFFER_SIZE,
     DEFAULT_LOG_LEVEL,
     MAX_PDF_CHARS,
+    PDF_CACHE_SIZE,
+    PDF_CACHE_ENABLED,
+    API_CACHE_PATH,
+    API_CACHE_TTL,
+    API_CACHE_MEMORY_SIZE,
+    API_CACHE_ENABLED,
     MAX_ITERATIONS,
     MAX_FUNCTION_ARG_LENGTH,
+    TOOL_CONCURRENCY,
+    TOOL_TIMEOUT,
+    EAGER_TOOLS,
 )
 
 __all__ = [
@@ -16,6 +25,15 @@ __all__ = [
     "MAX_LOG_BUFFER_SIZE",
     "DEFAULT_LOG_LEVEL",
     "MAX_PDF_CHARS",
+    "PDF_CACHE_SIZE",
+    "PDF_CACHE_ENABLED",
+    "API_CACHE_PATH",
+    "API_CACHE_TTL",
+    "API_CACHE_MEMORY_SIZE",
+    "API_CACHE_ENABLED",
     "MAX_ITERATIONS",
     "MAX_FUNCTION_ARG_LENGTH",
+    "TOOL_CONCURRENCY",
+    "TOOL_TIMEOUT",
+    "EAGER_TOOLS",
 ]
@@ -23,7 +23,18 @@ DEFAULT_LOG_LEVEL = "INFO"
 
 # PDF processing configuration
 MAX_PDF_CHARS = 10000
+PDF_CACHE_SIZE = 32  # Extracted PDF texts kept in memory
+PDF_CACHE_ENABLED = os.getenv("RA_DISABLE_PDF_CACHE", "").lower() not in ("1", "true", "yes")
+
+# External API cache configuration (DOI metadata lookups)
+API_CACHE_PATH = os.getenv("RA_API_CACHE_PATH", "~/.cache/research_arena/api.sqlite3")
+API_CACHE_TTL = 24 * 60 * 60  # Seconds before a cached lookup is refetched
+API_CACHE_MEMORY_SIZE = 1024  # Lookups kept in memory in front of the disk store
+API_CACHE_ENABLED = os.getenv("RA_DISABLE_API_CACHE", "").lower() not in ("1", "true", "yes")
 
 # Agentic loop configuration
 MAX_ITERATIONS = 10
 MAX_FUNCTION_ARG_LENGTH = 50000
+TOOL_CONCURRENCY = int(os.getenv("RA_TOOL_CONCURRENCY", "6"))  # Tool calls run at once
+TOOL_TIMEOUT = 60  # Seconds before a single tool call is abandoned
+EAGER_TOOLS = os.getenv("RA_EAGER_TOOLS", "").lower() in ("1", "true", "yes")  # Import every tool at startup
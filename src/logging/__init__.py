@@ -1,6 +1,7 @@
 """Logging module for the Agentic Research Assistant."""
 
 from .logger import (
+    LOG_LEVELS,
     LogBuffer,
     BufferHandler,
     log_buffer,
@@ -12,6 +13,7 @@ from .logger import (
 )
 
 __all__ = [
+    "LOG_LEVELS",
     "LogBuffer",
     "BufferHandler",
     "log_buffer",
@@ -4,47 +4,81 @@ Provides custom log buffer and handlers for tracking LLM interactions.
 """
 
 import logging
+import threading
+from collections import deque
 from datetime import datetime
 from src.config import MAX_LOG_BUFFER_SIZE, DEFAULT_LOG_LEVEL
 
 
+# Levels offered in the log viewer, lowest first
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+_LEVEL_NUMBERS = {level: getattr(logging, level) for level in LOG_LEVELS}
+
+
 class LogBuffer:
-    """Custom log buffer that stores logs in memory."""
+    """
+    Custom log buffer that stores logs in memory.
+
+    Each entry is formatted once on arrival and indexed per level, so showing
+    a level is a single join instead of a filter over the whole buffer. A
+    level's view holds entries at or above that level.
+    """
 
     def __init__(self):
-        self.buffer = []
         self.max_size = MAX_LOG_BUFFER_SIZE
+        self.buffer = deque(maxlen=self.max_size)
+        self._by_level = {
+            level: deque(maxlen=self.max_size) for level in ("ALL",) + LOG_LEVELS
+        }
+        self._lock = threading.Lock()
+        # Bumped on every change so readers can tell when nothing is new
+        self.version = 0
+        self._format_cache = {}
 
     def add(self, record):
         """Add a log record to the buffer."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        self.buffer.append({
+        entry = {
             "timestamp": timestamp,
             "level": record.levelname,
+            "levelno": record.levelno,
             "message": record.getMessage(),
             "module": record.module
-        })
-        # Keep only the last max_size entries
-        if len(self.buffer) > self.max_size:
-            self.buffer.pop(0)
+        }
+        line = f"[{timestamp}] {entry['level']:8} | {entry['module']:20} | {entry['message']}"
+        with self._lock:
+            # Deques drop their oldest entries beyond max_size
+            self.buffer.append(entry)
+            self.version += 1
+            self._by_level["ALL"].append(line)
+            for level, levelno in _LEVEL_NUMBERS.items():
+                if record.levelno >= levelno:
+                    self._by_level[level].append(line)
 
     def get_logs(self, level_filter="ALL"):
-        """Get logs filtered by level."""
-        if level_filter == "ALL":
-            return self.buffer
-        return [log for log in self.buffer if log["level"] == level_filter]
+        """Get logs at or above a level."""
+        with self._lock:
+            if level_filter == "ALL":
+                return list(self.buffer)
+            levelno = _LEVEL_NUMBERS.get(level_filter, logging.CRITICAL + 1)
+            return [log for log in self.buffer if log["levelno"] >= levelno]
 
     def clear(self):
         """Clear all logs from the buffer."""
-        self.buffer = []
+        with self._lock:
+            self.buffer.clear()
+            for lines in self._by_level.values():
+                lines.clear()
+            self.version += 1
 
     def format_logs(self, level_filter="ALL"):
-        """Format logs as a string for display."""
-        logs = self.get_logs(level_filter)
-        return "\n".join([
-            f"[{log['timestamp']}] {log['level']:8} | {log['module']:20} | {log['message']}"
-            for log in logs
-        ])
+        """Format logs at or above a level as a string for display."""
+        with self._lock:
+            cached_version, text = self._format_cache.get(level_filter, (-1, None))
+            if cached_version != self.version:
+                text = "\n".join(self._by_level.get(level_filter, ()))
+                self._format_cache[level_filter] = (self.version, text)
+            return text
 
 
 class BufferHandler(logging.Handler):
@@ -100,6 +100,8 @@ def create_app():
                     value=get_logs(),
                     elem_classes=["logs-display"],
                 )
+                # Buffer version last rendered, so refreshes can skip unchanged logs
+                logs_version = gr.State(None)
 
                 gr.Markdown(
                     """
@@ -112,7 +114,11 @@ def create_app():
                 )
 
                 # Event Handlers
-                refresh_btn.click(fn=refresh_logs, outputs=[logs_display])
+                refresh_btn.click(
+                    fn=refresh_logs,
+                    inputs=[log_level_dropdown, logs_version],
+                    outputs=[logs_display, logs_version],
+                )
 
                 clear_btn.click(fn=clear_logs, outputs=[logs_display])
 
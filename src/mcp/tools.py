@@ -8,16 +8,8 @@ making them accessible to MCP clients like Claude Desktop.
 import logging
 from typing import Dict, Any
 
-# Import async tools
-from src.tools import (
-    retrieve_related_papers,
-    explain_research_paper,
-    write_social_media_post,
-    process_uploaded_pdf,
-    generate_paper_infographic,
-    verify_document_sources,
-    recommend_similar_papers,
-)
+# Tools are called through the registry, which imports each one on its first call
+from src.utils.tool_registry import TOOL_SPECS, ToolId, dispatch
 
 # Import provider factory (uses LLM_PROVIDER env var for multi-provider support)
 from src.core.llm_provider import get_llm
@@ -46,118 +38,8 @@ def get_provider():
 # Tool Schemas (for MCP registration)
 # ============================================================================
 
-TOOL_SCHEMAS = {
-    "retrieve_related_papers": {
-        "name": "retrieve_related_papers",
-        "description": "Retrieve up to 5 recent arXiv papers matching the query. Uses LLM-refined queries and intelligent ranking.",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The search query for arXiv papers",
-                }
-            },
-            "required": ["query"],
-        },
-    },
-    "explain_research_paper": {
-        "name": "explain_research_paper",
-        "description": "Explain a research paper in clear, non-technical language (Modern Standard Arabic with technical terms in English). Generates 500-600 word summaries with pros/cons tables.",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "paper_info": {
-                    "type": "string",
-                    "description": "The research paper information to explain",
-                }
-            },
-            "required": ["paper_info"],
-        },
-    },
-    "write_social_media_post": {
-        "name": "write_social_media_post",
-        "description": "Create a social-media-friendly post (Arabic with Egyptian dialect) summarizing the paper. 200-300 words with multi-step generation.",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "explanation": {
-                    "type": "string",
-                    "description": "The explanation to convert into a social media post",
-                }
-            },
-            "required": ["explanation"],
-        },
-    },
-    "process_uploaded_pdf": {
-        "name": "process_uploaded_pdf",
-        "description": "Process and analyze an uploaded PDF research paper. Extracts text and provides structured summary.",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "pdf_path": {
-                    "type": "string",
-                    "description": "The file path to the uploaded PDF",
-                }
-            },
-            "required": ["pdf_path"],
-        },
-    },
-    "generate_paper_infographic": {
-        "name": "generate_paper_infographic",
-        "description": "Generate a beautiful academic infographic visualization from a research paper summary. Creates a visually stunning image perfect for social media sharing and presentations with 10 structured sections.",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "paper_info": {
-                    "type": "string",
-                    "description": "The research paper information or summary to visualize as an infographic",
-                }
-            },
-            "required": ["paper_info"],
-        },
-    },
-    "verify_document_sources": {
-        "name": "verify_document_sources",
-        "description": "Perform advanced source verification on a research document. Validates references against academic databases (Semantic Scholar, CrossRef), extracts and fact-checks verifiable claims, and detects potential issues like hallucinated citations. Returns comprehensive verification report.",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "document_text": {
-                    "type": "string",
-                    "description": "The full document text to verify (research paper, article, report, etc.)",
-                },
-                "verify_claims": {
-                    "type": "boolean",
-                    "description": "Whether to extract and verify claims (default: true)",
-                },
-                "verify_references": {
-                    "type": "boolean",
-                    "description": "Whether to validate references and citations (default: true)",
-                }
-            },
-            "required": ["document_text"],
-        },
-    },
-    "recommend_similar_papers": {
-        "name": "recommend_similar_papers",
-        "description": "Recommend similar research papers based on a given paper's DOI, arXiv ID, title, or content. Uses Semantic Scholar's recommendation engine to find contextually similar papers for literature review.",
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "paper_info": {
-                    "type": "string",
-                    "description": "Paper information: DOI (e.g., '10.xxxx/xxxx'), arXiv ID (e.g., 'arXiv:2101.12345'), paper title, or paper content/abstract",
-                },
-                "num_recommendations": {
-                    "type": "integer",
-                    "description": "Number of similar papers to recommend (default: 10, max: 20)",
-                }
-            },
-            "required": ["paper_info"],
-        },
-    },
-}
+# Derived from the shared tool registry so MCP and chat advertise the same tools
+TOOL_SCHEMAS = {spec.name: spec.as_mcp() for spec in TOOL_SPECS}
 
 
 # ============================================================================
@@ -176,7 +58,7 @@ async def mcp_retrieve_related_papers(query: str) -> str:
     """
     logger.info(f"🔍 MCP Tool: retrieve_related_papers(query='{query[:50]}...')")
     provider = get_provider()
-    result = await retrieve_related_papers(query, provider)
+    result = await dispatch(ToolId.RETRIEVE_RELATED_PAPERS, query, provider=provider)
     return result
 
 
@@ -192,7 +74,7 @@ async def mcp_explain_research_paper(paper_info: str) -> str:
     """
     logger.info(f"🔍 MCP Tool: explain_research_paper")
     provider = get_provider()
-    result = await explain_research_paper(paper_info, provider)
+    result = await dispatch(ToolId.EXPLAIN_RESEARCH_PAPER, paper_info, provider=provider)
     return result
 
 
@@ -208,7 +90,7 @@ async def mcp_write_social_media_post(explanation: str) -> str:
     """
     logger.info(f"🔍 MCP Tool: write_social_media_post")
     provider = get_provider()
-    result = await write_social_media_post(explanation, provider)
+    result = await dispatch(ToolId.WRITE_SOCIAL_MEDIA_POST, explanation, provider=provider)
     return result
 
 
@@ -224,7 +106,7 @@ async def mcp_process_uploaded_pdf(pdf_path: str) -> str:
     """
     logger.info(f"🔍 MCP Tool: process_uploaded_pdf(pdf_path='{pdf_path}')")
     provider = get_provider()
-    result = await process_uploaded_pdf(pdf_path, provider)
+    result = await dispatch(ToolId.PROCESS_UPLOADED_PDF, pdf_path, provider=provider)
     return result
 
 
@@ -240,7 +122,7 @@ async def mcp_generate_paper_infographic(paper_info: str) -> str:
     """
     logger.info(f"🔍 MCP Tool: generate_paper_infographic")
     provider = get_provider()
-    result = await generate_paper_infographic(paper_info, provider)
+    result = await dispatch(ToolId.GENERATE_PAPER_INFOGRAPHIC, paper_info, provider=provider)
     return result
 
 
@@ -262,7 +144,13 @@ async def mcp_verify_document_sources(
     """
     logger.info(f"🔍 MCP Tool: verify_document_sources")
     provider = get_provider()
-    result = await verify_document_sources(document_text, provider, verify_claims, verify_references)
+    result = await dispatch(
+        ToolId.VERIFY_DOCUMENT_SOURCES,
+        document_text,
+        provider=provider,
+        verify_claims=verify_claims,
+        verify_references=verify_references,
+    )
     return result
 
 
@@ -281,7 +169,10 @@ async def mcp_recommend_similar_papers(
         Recommendations text
     """
     logger.info(f"🔍 MCP Tool: recommend_similar_papers")
-    result = await recommend_similar_papers(paper_info, num_recommendations)
+    provider = get_provider()
+    result = await dispatch(
+        ToolId.RECOMMEND_SIMILAR_PAPERS, paper_info, provider=provider, num_recommendations=num_recommendations
+    )
     return result
 
 
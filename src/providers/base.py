@@ -7,7 +7,7 @@ It provides a consistent interface for interacting with different LLM providers
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple, Type
 from dataclasses import dataclass
 from enum import Enum
 
@@ -65,6 +65,9 @@ class BaseLLMProvider(ABC):
     to ensure consistent behavior across the application.
     """
 
+    # Exceptions signalling a transient failure (rate limit, timeout) that callers may retry
+    transient_errors: Tuple[Type[Exception], ...] = (TimeoutError, ConnectionError)
+
     def __init__(self, api_key: str, model_name: Optional[str] = None):
         """
         Initialize the LLM provider.
@@ -132,13 +135,40 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def generate_simple_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a simple text response from a prompt, chunk by chunk.
+
+        Providers that support streaming should override this. The default
+        implementation yields the complete generate_simple() result as a
+        single chunk so callers can always consume responses incrementally.
+
+        Args:
+            prompt: The input prompt
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Text chunks in generation order
+
+        Raises:
+            Exception: If the API call fails
+        """
+        yield await self.generate_simple(prompt, temperature=temperature, max_tokens=max_tokens)
+
     @abstractmethod
     async def generate(
         self,
         messages: List[Message],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
-        tools: Optional[List[Tool]] = None
+        tools: Optional[List[Tool]] = None,
+        files: Optional[List[Any]] = None
     ) -> LLMResponse:
         """
         Generate a response with full conversation support and optional tools.
@@ -151,6 +181,8 @@ class BaseLLMProvider(ABC):
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
             tools: Optional list of tools the LLM can call
+            files: Optional file attachments (local paths or provider file references)
+                   added to the last user message. Requires supports_vision.
 
         Returns:
             LLMResponse object containing the response and any function calls
@@ -160,6 +192,43 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Tool]] = None,
+        files: Optional[List[Any]] = None
+    ) -> AsyncIterator[LLMResponse]:
+        """
+        Stream a response with conversation support, chunk by chunk.
+
+        Each chunk is a partial LLMResponse whose content is the newly generated
+        text (not the accumulated text) and whose function_calls are the calls
+        completed in that chunk. The default implementation yields the complete
+        generate() result as a single chunk.
+
+        Args:
+            messages: List of conversation messages
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            tools: Optional list of tools the LLM can call
+            files: Optional file attachments, as for generate()
+
+        Yields:
+            Partial LLMResponse objects in generation order
+
+        Raises:
+            Exception: If the API call fails
+        """
+        yield await self.generate(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            files=files
+        )
+
     @abstractmethod
     async def generate_with_image(
         self,
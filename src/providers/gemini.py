@@ -7,9 +7,11 @@ Supports all Gemini capabilities including function calling and multimodal input
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 import google.generativeai as genai
-from google.generativeai.types import GenerationConfig
+from google.api_core import exceptions as google_exceptions
+from google.generativeai import protos
+from google.generativeai.types import GenerationConfig, content_types
 
 from .base import (
     BaseLLMProvider,
@@ -22,6 +24,9 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Finish reasons reported to callers as a malformed function call
+_MALFORMED = {protos.Candidate.FinishReason.MALFORMED_FUNCTION_CALL}
+
 
 class GeminiProvider(BaseLLMProvider):
     """
@@ -31,9 +36,18 @@ class GeminiProvider(BaseLLMProvider):
     - Text generation
     - Function/tool calling
     - Vision/multimodal inputs
-    - Streaming (future)
+    - Streaming (simple text generation and chat with tools)
     """
 
+    transient_errors = (
+        TimeoutError,
+        ConnectionError,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.InternalServerError,
+    )
+
     @property
     def provider_name(self) -> str:
         return "gemini"
@@ -58,6 +72,9 @@ class GeminiProvider(BaseLLMProvider):
         """Initialize Gemini provider and configure API."""
         super().__init__(api_key, model_name)
         genai.configure(api_key=self.api_key)
+        # Last tool list converted and its function library; callers pass the
+        # same list on every turn, so the conversion is only done once
+        self._function_library: Optional[Tuple[List[Tool], Any]] = None
         logger.info(f"🔧 Initialized Gemini provider with model: {self.model_name}")
 
     def _convert_message_to_gemini_format(self, message: Message) -> Dict[str, Any]:
@@ -91,22 +108,27 @@ class GeminiProvider(BaseLLMProvider):
             } for tool in tools]
         }]
 
-    def _extract_function_calls(self, response) -> List[FunctionCall]:
-        """Extract function calls from Gemini response."""
+    def _get_function_library(self, tools: List[Tool]) -> Any:
+        """Convert tools to a Gemini function library, reusing the last conversion for the same list."""
+        if self._function_library is None or self._function_library[0] is not tools:
+            library = content_types.to_function_library(self._convert_tools_to_gemini_format(tools))
+            self._function_library = (tools, library)
+        return self._function_library[1]
+
+    def _extract_function_calls(self, candidate) -> List[FunctionCall]:
+        """Extract function calls from the first candidate of a Gemini response."""
         function_calls = []
 
-        if hasattr(response, 'candidates') and response.candidates:
-            candidate = response.candidates[0]
-            if hasattr(candidate.content, 'parts'):
-                for part in candidate.content.parts:
-                    if hasattr(part, 'function_call') and part.function_call:
-                        fc = part.function_call
-                        # Convert Gemini's function call to our format
-                        args = dict(fc.args) if hasattr(fc.args, 'items') else {}
-                        function_calls.append(FunctionCall(
-                            name=fc.name,
-                            arguments=args
-                        ))
+        if candidate is not None:
+            for part in candidate.content.parts:
+                fc = part.function_call
+                if fc:
+                    # Convert Gemini's function call to our format
+                    args = dict(fc.args) if hasattr(fc.args, 'items') else {}
+                    function_calls.append(FunctionCall(
+                        name=fc.name,
+                        arguments=args
+                    ))
 
         return function_calls
 
@@ -147,22 +169,108 @@ class GeminiProvider(BaseLLMProvider):
             logger.error(f"❌ Gemini generation failed: {e}")
             raise
 
+    async def generate_simple_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Stream a simple text response from a prompt as chunks arrive."""
+        logger.debug(f"📤 Gemini streaming generation request: {prompt[:100]}...")
+
+        try:
+            model = genai.GenerativeModel(model_name=self.model_name)
+
+            generation_config = GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens
+            )
+
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=generation_config,
+                stream=True
+            )
+
+            async for chunk in response:
+                # Trailing chunks may only carry finish metadata
+                if chunk.parts:
+                    yield chunk.text
+
+            logger.debug("📥 Gemini streaming response complete")
+
+        except Exception as e:
+            logger.error(f"❌ Gemini streaming generation failed: {e}")
+            raise
+
+    async def _start_chat(
+        self,
+        messages: List[Message],
+        tools: Optional[List[Tool]] = None,
+        files: Optional[List[Any]] = None
+    ) -> Tuple[Any, Any]:
+        """Start a chat session from all but the last message and return it with the last message's content."""
+        # Convert messages to Gemini format
+        gemini_messages = [
+            self._convert_message_to_gemini_format(msg)
+            for msg in messages
+        ]
+
+        # Attach files to the last user message so they stay in the history
+        # across tool-calling turns
+        attach_index = None
+        if files:
+            self.validate_supports_vision()
+            uploaded_files = await self._upload_files(files)
+            attach_index = max(
+                i for i, msg in enumerate(messages) if msg.role == MessageRole.USER
+            )
+            text_parts = gemini_messages[attach_index]["parts"] if messages[attach_index].content else []
+            gemini_messages[attach_index]["parts"] = uploaded_files + text_parts
+
+        # Create model with or without tools
+        if tools:
+            model = genai.GenerativeModel(
+                model_name=self.model_name,
+                tools=self._get_function_library(tools)
+            )
+        else:
+            model = genai.GenerativeModel(model_name=self.model_name)
+
+        # Start chat with history (all but last message)
+        chat = model.start_chat(history=gemini_messages[:-1] if len(gemini_messages) > 1 else [])
+
+        # Content for the last message
+        if attach_index == len(messages) - 1:
+            last_message_content = gemini_messages[-1]["parts"]
+        else:
+            last_message_content = messages[-1].content
+
+        return chat, last_message_content
+
+    @staticmethod
+    def _finish_reason(candidate) -> str:
+        """Map a candidate's finish reason enum to our lowercase name (str() of it is just the number)."""
+        fr = getattr(candidate, 'finish_reason', None)
+        if fr in _MALFORMED:
+            return "malformed_function_call"
+        if fr:
+            return fr.name.lower()
+        return "stop"
+
     async def generate(
         self,
         messages: List[Message],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
-        tools: Optional[List[Tool]] = None
+        tools: Optional[List[Tool]] = None,
+        files: Optional[List[Any]] = None
     ) -> LLMResponse:
-        """Generate a response with conversation history and optional tools."""
+        """Generate a response with conversation history, optional tools and file attachments."""
         logger.debug(f"📤 Gemini generation request with {len(messages)} messages")
 
         try:
-            # Convert messages to Gemini format
-            gemini_messages = [
-                self._convert_message_to_gemini_format(msg)
-                for msg in messages
-            ]
+            chat, last_message_content = await self._start_chat(messages, tools, files)
 
             # Configure generation parameters
             generation_config = GenerationConfig(
@@ -170,22 +278,6 @@ class GeminiProvider(BaseLLMProvider):
                 max_output_tokens=max_tokens
             )
 
-            # Create model with or without tools
-            if tools:
-                gemini_tools = self._convert_tools_to_gemini_format(tools)
-                model = genai.GenerativeModel(
-                    model_name=self.model_name,
-                    tools=gemini_tools
-                )
-            else:
-                model = genai.GenerativeModel(model_name=self.model_name)
-
-            # Start chat with history (all but last message)
-            chat = model.start_chat(history=gemini_messages[:-1] if len(gemini_messages) > 1 else [])
-
-            # Send last message
-            last_message_content = messages[-1].content
-
             # Run in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
@@ -196,8 +288,10 @@ class GeminiProvider(BaseLLMProvider):
                 )
             )
 
+            candidate = response.candidates[0] if response.candidates else None
+
             # Extract function calls if present
-            function_calls = self._extract_function_calls(response)
+            function_calls = self._extract_function_calls(candidate)
 
             # Extract text content
             content = None
@@ -214,12 +308,7 @@ class GeminiProvider(BaseLLMProvider):
                 # If there are function calls, don't try to extract text
                 logger.debug("Response contains function calls, skipping text extraction")
 
-            # Get finish reason
-            finish_reason = "stop"
-            if hasattr(response, 'candidates') and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'finish_reason'):
-                    finish_reason = str(candidate.finish_reason)
+            finish_reason = self._finish_reason(candidate)
 
             # Get usage info if available
             usage = None
@@ -243,6 +332,57 @@ class GeminiProvider(BaseLLMProvider):
             logger.error(f"❌ Gemini generation failed: {e}")
             raise
 
+    async def generate_stream(
+        self,
+        messages: List[Message],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Tool]] = None,
+        files: Optional[List[Any]] = None
+    ) -> AsyncIterator[LLMResponse]:
+        """Stream a response as partial LLMResponse chunks as they arrive."""
+        logger.debug(f"📤 Gemini streaming request with {len(messages)} messages")
+
+        try:
+            chat, last_message_content = await self._start_chat(messages, tools, files)
+
+            generation_config = GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens
+            )
+
+            response = await chat.send_message_async(
+                last_message_content,
+                generation_config=generation_config,
+                stream=True
+            )
+
+            async for chunk in response:
+                candidate = chunk.candidates[0] if chunk.candidates else None
+                text = "".join(part.text for part in candidate.content.parts) if candidate else ""
+                yield LLMResponse(
+                    content=text or None,
+                    function_calls=self._extract_function_calls(candidate),
+                    finish_reason=self._finish_reason(candidate)
+                )
+
+            logger.debug("📥 Gemini streaming response complete")
+
+        except Exception as e:
+            logger.error(f"❌ Gemini streaming generation failed: {e}")
+            raise
+
+    async def _upload_files(self, files: List[Any]) -> List[Any]:
+        """Upload local file paths concurrently; pass through already uploaded files."""
+        from src.utils.file_upload_cache import upload_file_cached
+
+        async def _resolve(file):
+            if isinstance(file, str):
+                return await upload_file_cached(file)
+            return file
+
+        return list(await asyncio.gather(*(_resolve(file) for file in files)))
+
     async def generate_with_image(
         self,
         prompt: str,
@@ -258,12 +398,10 @@ class GeminiProvider(BaseLLMProvider):
             # Create model
             model = genai.GenerativeModel(model_name=self.model_name)
 
-            # Upload image file
+            # Upload image file (reusing an earlier upload of the same content)
+            from src.utils.file_upload_cache import upload_file_cached
             loop = asyncio.get_event_loop()
-            uploaded_file = await loop.run_in_executor(
-                None,
-                lambda: genai.upload_file(image_path)
-            )
+            uploaded_file = await upload_file_cached(image_path)
 
             logger.debug(f"📎 Uploaded file: {uploaded_file.name}")
 
@@ -1,23 +1,32 @@
 """Tools module for the Agentic Research Assistant."""
 
-from .arxiv_search import retrieve_related_papers
-from .explainer import explain_research_paper
-from .social_post import write_social_media_post
-from .pdf_processor import extract_text_from_pdf, process_uploaded_pdf
-from .infographic_generator import generate_paper_infographic
-from .source_verifier import verify_document_sources, quick_verify_references, quick_verify_claims
-from .paper_recommender import recommend_similar_papers, quick_recommend
+import importlib
 
-__all__ = [
-    "retrieve_related_papers",
-    "explain_research_paper",
-    "write_social_media_post",
-    "extract_text_from_pdf",
-    "process_uploaded_pdf",
-    "generate_paper_infographic",
-    "verify_document_sources",
-    "quick_verify_references",
-    "quick_verify_claims",
-    "recommend_similar_papers",
-    "quick_recommend",
-]
+# Tools are imported from their module on first access (PEP 562), so using
+# one tool does not load the dependencies of all the others
+_LAZY_ATTRS = {
+    "retrieve_related_papers": ".arxiv_search",
+    "explain_research_paper": ".explainer",
+    "write_social_media_post": ".social_post",
+    "extract_text_from_pdf": ".pdf_processor",
+    "process_uploaded_pdf": ".pdf_processor",
+    "process_uploaded_pdf_from_text": ".pdf_processor",
+    "PDFExtractionError": ".pdf_processor",
+    "generate_paper_infographic": ".infographic_generator",
+    "verify_document_sources": ".source_verifier",
+    "quick_verify_references": ".source_verifier",
+    "quick_verify_claims": ".source_verifier",
+    "recommend_similar_papers": ".paper_recommender",
+    "quick_recommend": ".paper_recommender",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = list(_LAZY_ATTRS)
@@ -12,6 +12,7 @@ from src.providers.base import BaseLLMProvider
 
 async def retrieve_related_papers(
     query: str,
+    *,
     provider: BaseLLMProvider,
     max_results: int = 5
 ) -> str:
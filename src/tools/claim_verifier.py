@@ -8,7 +8,11 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from src.logging import logger
 from src.providers.base import BaseLLMProvider
-from src.utils.api_clients import SemanticScholarAPI, RateLimiter
+from src.utils.api_clients import get_host_limiter, get_semantic_scholar
+
+
+# Claims verified at once (each makes one search and one LLM call)
+CLAIM_CONCURRENCY = 4
 
 
 class ClaimExtractor:
@@ -110,8 +114,8 @@ class ClaimVerifier:
     
     def __init__(self, provider: BaseLLMProvider):
         self.provider = provider
-        self.semantic_scholar = SemanticScholarAPI()
-        self.rate_limiter = RateLimiter(calls_per_second=1.5)
+        self.semantic_scholar = get_semantic_scholar()
+        self.rate_limiter = get_host_limiter(self.semantic_scholar.BASE_URL)
     
     def load_verification_prompt(self) -> str:
         """Load claim verification prompt."""
@@ -167,11 +171,10 @@ Format as JSON object."""
         logger.info(f"🔍 Verifying claim: '{claim_text[:80]}...'")
         
         # Step 1: Gather evidence
-        await asyncio.sleep(self.rate_limiter.wait_time())
-        evidence = await self._gather_evidence(claim_text)
+        async with self.rate_limiter:
+            evidence = await self._gather_evidence(claim_text)
         
         # Step 2: LLM-based verification
-        await asyncio.sleep(self.rate_limiter.wait_time())
         verification_result = await self._llm_verify(claim, evidence)
         
         # Add claim metadata
@@ -322,12 +325,17 @@ async def verify_all_claims(
             }
         }
     
-    # Verify each claim
-    verification_results = []
-    for i, claim in enumerate(claims, 1):
-        logger.info(f"📋 Verifying claim {i}/{len(claims)}...")
-        result = await verifier.verify_claim(claim)
-        verification_results.append(result)
+    # Verify claims concurrently; the Semantic Scholar rate limiter still spaces out the API calls
+    semaphore = asyncio.Semaphore(CLAIM_CONCURRENCY)
+    
+    async def _verify(i: int, claim: Dict[str, str]) -> Dict[str, Any]:
+        async with semaphore:
+            logger.info(f"📋 Verifying claim {i}/{len(claims)}...")
+            return await verifier.verify_claim(claim)
+    
+    verification_results = list(await asyncio.gather(
+        *(_verify(i, claim) for i, claim in enumerate(claims, 1))
+    ))
     
     # Generate summary
     summary = {
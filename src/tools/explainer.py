@@ -27,6 +27,7 @@ Use Modern Standard Arabic with technical terms in English."""
 
 async def explain_research_paper(
     paper_info: str,
+    *,
     provider: BaseLLMProvider
 ) -> str:
     """
@@ -261,6 +261,7 @@ The structured summary has been logged and can be exported."""
 
 async def generate_paper_infographic(
     paper_info: str,
+    *,
     provider: BaseLLMProvider
 ) -> str:
     """
@@ -8,14 +8,21 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from src.logging import logger
 from src.providers.base import BaseLLMProvider
-from src.utils.api_clients import SemanticScholarAPI
+from src.utils.api_clients import get_semantic_scholar
+
+
+async def ensure_ready() -> None:
+    """Warm up the Semantic Scholar connection ahead of a recommendation request."""
+    client = get_semantic_scholar()
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, client.warm_up)
 
 
 class PaperRecommender:
     """Recommend similar papers based on paper ID, title, or content."""
     
     def __init__(self, provider: BaseLLMProvider):
-        self.semantic_scholar = SemanticScholarAPI()
+        self.semantic_scholar = get_semantic_scholar()
         self.provider = provider
     
     async def get_recommendations_by_id(self, paper_id: str, id_type: str = "doi", limit: int = 10) -> List[Dict[str, Any]]:
@@ -192,6 +199,7 @@ Provide only the search query, no explanation.
 
 async def recommend_similar_papers(
     paper_info: str,
+    *,
     provider: BaseLLMProvider,
     num_recommendations: int = 10
 ) -> str:
@@ -367,4 +375,4 @@ async def quick_recommend(
         Formatted recommendations
     """
     logger.info(f"🔍 Quick recommendation for: {doi_or_arxiv}")
-    return await recommend_similar_papers(doi_or_arxiv, provider, num_recommendations=num_papers)
+    return await recommend_similar_papers(doi_or_arxiv, provider=provider, num_recommendations=num_papers)
@@ -11,88 +11,138 @@ except ImportError:
     except ImportError:
         pypdf = None
 
-import asyncio
-from src.config import MAX_PDF_CHARS
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+from src.config import MAX_PDF_CHARS, PDF_CACHE_SIZE, PDF_CACHE_ENABLED
 from src.logging import logger
 from src.providers.base import BaseLLMProvider
+from src.utils.pdf_pool import run_in_pdf_pool
 
 
-async def extract_text_from_pdf(pdf_path: str) -> str:
+class PDFExtractionError(Exception):
+    """Raised when text cannot be extracted from a PDF file."""
+
+
+# LRU cache of extracted text keyed on (path, mtime, size)
+_PDF_TEXT_CACHE: "OrderedDict[Tuple[str, float, int], str]" = OrderedDict()
+
+
+def _pdf_cache_key(pdf_path: str) -> Optional[Tuple[str, float, int]]:
+    """Build a cache key that changes whenever the file is modified."""
+    try:
+        stat = os.stat(pdf_path)
+    except OSError:
+        return None
+    return (pdf_path, stat.st_mtime, stat.st_size)
+
+
+def _extract_text_sync(pdf_path: str, max_chars: Optional[int] = None) -> str:
+    """
+    Synchronous PDF extraction, run in a worker process.
+    
+    Stops at the first page that brings the text to max_chars. Logging is
+    left to the caller in the main process.
+    
+    Raises:
+        PDFExtractionError: If the PDF cannot be read
+    """
+    try:
+        # Try pypdf first
+        if hasattr(pypdf, 'PdfReader'):
+            reader = pypdf.PdfReader(pdf_path)
+            
+            text_content = []
+            total_chars = 0
+            for i, page in enumerate(reader.pages, 1):
+                text = page.extract_text()
+                if text.strip():
+                    text_content.append(f"--- Page {i} ---\n{text}")
+                    total_chars += len(text_content[-1])
+                    if max_chars is not None and total_chars >= max_chars:
+                        break
+            
+            return "\n\n".join(text_content)
+        
+        # Fallback to PyPDF2 API
+        elif hasattr(pypdf, 'PdfFileReader'):
+            with open(pdf_path, 'rb') as file:
+                reader = pypdf.PdfFileReader(file)
+                
+                text_content = []
+                total_chars = 0
+                for i in range(reader.numPages):
+                    page = reader.getPage(i)
+                    text = page.extractText()
+                    if text.strip():
+                        text_content.append(f"--- Page {i+1} ---\n{text}")
+                        total_chars += len(text_content[-1])
+                        if max_chars is not None and total_chars >= max_chars:
+                            break
+                
+                return "\n\n".join(text_content)
+        else:
+            raise PDFExtractionError("Unsupported pypdf version")
+    
+    except PDFExtractionError:
+        raise
+    except Exception as e:
+        raise PDFExtractionError(f"Error extracting PDF text: {str(e)}") from e
+
+
+async def extract_text_from_pdf(pdf_path: str, max_chars: Optional[int] = None) -> str:
     """
     Extract text content from a PDF file.
     
     Args:
         pdf_path: Path to the PDF file
+        max_chars: Stop parsing pages once this many characters are extracted
+                   (the result may run past it to the end of a page). Partial
+                   extractions are not cached.
         
     Returns:
         Extracted text content
+        
+    Raises:
+        PDFExtractionError: If the PDF cannot be read or PDF support is missing
     """
     logger.info(f"🔍 FUNCTION CALL: extract_text_from_pdf(pdf_path='{pdf_path}')")
     
     if pypdf is None:
         error_msg = "PDF support not available. Please install pypdf: pip install pypdf"
         logger.error(f"❌ {error_msg}")
-        return error_msg
+        raise PDFExtractionError(error_msg)
     
-    def _extract_sync():
-        """Synchronous PDF extraction wrapped for async execution."""
-        try:
-            logger.debug(f"📄 Opening PDF file: {pdf_path}")
-            
-            # Try pypdf first
-            if hasattr(pypdf, 'PdfReader'):
-                reader = pypdf.PdfReader(pdf_path)
-                logger.info(f"📚 PDF loaded: {len(reader.pages)} pages")
-                
-                text_content = []
-                for i, page in enumerate(reader.pages, 1):
-                    logger.debug(f"  Extracting text from page {i}/{len(reader.pages)}")
-                    text = page.extract_text()
-                    if text.strip():
-                        text_content.append(f"--- Page {i} ---\n{text}")
-                
-                full_text = "\n\n".join(text_content)
-                logger.info(f"✅ PDF text extracted: {len(full_text)} characters")
-                return full_text
-            
-            # Fallback to PyPDF2 API
-            elif hasattr(pypdf, 'PdfFileReader'):
-                with open(pdf_path, 'rb') as file:
-                    reader = pypdf.PdfFileReader(file)
-                    logger.info(f"📚 PDF loaded: {reader.numPages} pages")
-                    
-                    text_content = []
-                    for i in range(reader.numPages):
-                        logger.debug(f"  Extracting text from page {i+1}/{reader.numPages}")
-                        page = reader.getPage(i)
-                        text = page.extractText()
-                        if text.strip():
-                            text_content.append(f"--- Page {i+1} ---\n{text}")
-                    
-                    full_text = "\n\n".join(text_content)
-                    logger.info(f"✅ PDF text extracted: {len(full_text)} characters")
-                    return full_text
-            else:
-                error_msg = "Unsupported pypdf version"
-                logger.error(f"❌ {error_msg}")
-                return error_msg
-        
-        except Exception as e:
-            error_msg = f"Error extracting PDF text: {str(e)}"
-            logger.error(f"❌ {error_msg}")
-            return error_msg
+    cache_key = _pdf_cache_key(pdf_path) if PDF_CACHE_ENABLED else None
+    if cache_key is not None and cache_key in _PDF_TEXT_CACHE:
+        _PDF_TEXT_CACHE.move_to_end(cache_key)
+        logger.debug(f"📄 Using cached PDF text for {pdf_path}")
+        return _PDF_TEXT_CACHE[cache_key]
     
-    # Run PDF extraction in thread pool to avoid blocking
+    # Run PDF extraction in the process pool to avoid blocking (and the GIL)
+    # The worker process can't reach our log buffer, so report the outcome here
     try:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _extract_sync)
+        text = await run_in_pdf_pool(_extract_text_sync, pdf_path, max_chars)
+    except PDFExtractionError as e:
+        logger.error(f"❌ {str(e)}")
+        raise
     except Exception as e:
         error_msg = f"Error in async PDF extraction: {str(e)}"
         logger.error(f"❌ {error_msg}")
-        return error_msg
+        raise PDFExtractionError(error_msg) from e
+    
+    logger.info(f"✅ PDF text extracted: {len(text)} characters")
+    
+    # Only cache complete extractions
+    if cache_key is not None and max_chars is None:
+        _PDF_TEXT_CACHE[cache_key] = text
+        if len(_PDF_TEXT_CACHE) > PDF_CACHE_SIZE:
+            _PDF_TEXT_CACHE.popitem(last=False)
+    
+    return text
 
 
-async def process_uploaded_pdf(pdf_path: str, provider: BaseLLMProvider) -> str:
+async def process_uploaded_pdf(pdf_path: str, *, provider: BaseLLMProvider) -> str:
     """
     Process an uploaded PDF and return a summary of its content.
     
@@ -106,11 +156,25 @@ async def process_uploaded_pdf(pdf_path: str, provider: BaseLLMProvider) -> str:
     logger.info(f"🔍 FUNCTION CALL: process_uploaded_pdf(pdf_path='{pdf_path}')")
     
     # Extract text from PDF (async)
-    pdf_text = await extract_text_from_pdf(pdf_path)
+    try:
+        pdf_text = await extract_text_from_pdf(pdf_path)
+    except PDFExtractionError as e:
+        return str(e)
     
-    if pdf_text.startswith("Error") or pdf_text.startswith("PDF support"):
-        return pdf_text
+    return await process_uploaded_pdf_from_text(pdf_text, provider)
+
+
+async def process_uploaded_pdf_from_text(pdf_text: str, provider: BaseLLMProvider) -> str:
+    """
+    Summarize PDF content that has already been extracted.
     
+    Args:
+        pdf_text: Text extracted from the PDF
+        provider: LLM provider instance
+        
+    Returns:
+        Structured summary of the PDF content
+    """
     # Limit text length for LLM processing
     if len(pdf_text) > MAX_PDF_CHARS:
         logger.debug(f"  Truncating PDF text from {len(pdf_text)} to {MAX_PDF_CHARS} chars")
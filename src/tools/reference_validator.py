@@ -6,10 +6,159 @@ Validates citations, DOIs, and reference metadata against academic databases.
 import re
 import json
 import asyncio
-from typing import List, Dict, Any, Optional
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, AsyncIterator, NamedTuple, Set, Tuple
+from tenacity import AsyncRetrying, retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from src.logging import logger
 from src.providers.base import BaseLLMProvider
-from src.utils.api_clients import SemanticScholarAPI, CrossRefAPI, RateLimiter
+from src.utils.api_clients import get_host_limiter, get_semantic_scholar, get_crossref
+
+
+# Shared session for URL checks so keep-alive reuses TCP/TLS connections across references
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Maximum number of concurrent URL accessibility checks
+_URL_CHECK_WORKERS = 20
+
+# Long-lived pool for the blocking HEAD checks. Created once so a check never
+# builds or tears down a pool (whose shutdown would block the event loop)
+_URL_CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=_URL_CHECK_WORKERS, thread_name_prefix="url-check")
+
+# Syntactically valid DOI; anything else is not worth an API call
+_DOI_RE = re.compile(r'^10\.\d{4,9}/[-._;()/:A-Z0-9<>\[\]]+$', re.IGNORECASE)
+_DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', re.IGNORECASE)
+# DOIs anywhere in running text (used when LLM extraction fails)
+_DOI_IN_TEXT_RE = re.compile(r'10\.\d{4,}/[^\s]+')
+
+# Most references the regex fallback returns
+_FALLBACK_MAX_REFERENCES = 20
+
+
+# A single quick retry: check_urls waits for every URL, so the slowest
+# check sets the latency of the whole batch
+@retry(
+    stop=stop_after_attempt(2),
+    wait=wait_random_exponential(multiplier=0.5, max=2),
+    retry=retry_if_exception_type(requests.exceptions.Timeout),
+    reraise=True,
+)
+def _head(url: str) -> requests.Response:
+    """HEAD a URL, retrying a timeout once after a short jittered backoff."""
+    return _session.head(url, timeout=5, allow_redirects=True)
+
+
+class _JsonArrayStream:
+    """Incrementally decode the items of a JSON array from streamed text chunks."""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self.finished = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        Add a chunk of text and return the array items it completed.
+
+        Any text before the opening bracket (e.g. a markdown code fence) is skipped.
+
+        Args:
+            chunk: Next piece of the streamed response
+
+        Returns:
+            List of fully decoded array items (may be empty)
+        """
+        items = []
+        if self.finished:
+            return items
+
+        self._buffer += chunk
+        if not self._started:
+            start = self._buffer.find('[')
+            if start == -1:
+                return items
+            self._buffer = self._buffer[start + 1:]
+            self._started = True
+
+        buffer = self._buffer
+        pos = 0
+        while True:
+            while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ','):
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                self.finished = True
+                pos += 1
+                break
+            try:
+                item, pos = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Item not complete yet - wait for more text
+                break
+            items.append(item)
+
+        # Drop consumed text so the buffer only holds the pending item
+        self._buffer = buffer[pos:]
+        return items
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for equality checks (scheme, 'www.', case, trailing slash)."""
+    url = url.strip().lower()
+    url = re.sub(r'^https?://', '', url)
+    if url.startswith('www.'):
+        url = url[4:]
+    return url.rstrip('/')
+
+
+def _clean_doi(doi: str) -> str:
+    """Strip URL/'doi:' prefixes and trailing punctuation from a cited DOI."""
+    return _DOI_PREFIX_RE.sub('', doi.strip()).rstrip('.,;')
+
+
+class _NormalizedReference(NamedTuple):
+    """Comparison fields derived from a reference, kept apart from the reference itself."""
+    doi: str
+    malformed_doi: bool
+    title: str
+    title_tokens: Set[str]
+    authors: List[str]
+    first_author: str
+    year: str
+
+
+def _normalize_reference(reference: Dict[str, Any]) -> _NormalizedReference:
+    """
+    Precompute normalized comparison fields for a reference.
+    
+    Done once per reference so metadata comparison does not re-lowercase
+    and re-split the same strings on every validation pass. The cited DOI is
+    also cleaned and syntax-checked, so malformed DOIs never reach the APIs.
+    The reference dict itself is left untouched, since it is returned to callers.
+    """
+    raw_doi = str(reference.get('doi') or '')
+    doi = _clean_doi(raw_doi)
+    doi = doi if _DOI_RE.match(doi) else ''
+    
+    title = str(reference.get('title') or '').lower().strip()
+    authors = str(reference.get('authors') or '').lower()
+    author_list = [a.strip() for a in authors.split(',') if a.strip()]
+    
+    return _NormalizedReference(
+        doi=doi,
+        malformed_doi=bool(raw_doi.strip()) and not doi,
+        title=title,
+        title_tokens=set(title.split()),
+        authors=author_list,
+        first_author=author_list[0] if author_list else '',
+        year=str(reference.get('year') or '').strip(),
+    )
 
 
 class ReferenceExtractor:
@@ -18,20 +167,9 @@ class ReferenceExtractor:
     def __init__(self, provider: BaseLLMProvider):
         self.provider = provider
     
-    async def extract_references(self, document_text: str) -> List[Dict[str, str]]:
-        """
-        Extract all references from a document using LLM.
-        
-        Args:
-            document_text: Full document text
-            
-        Returns:
-            List of reference dictionaries with parsed components
-        """
-        logger.info("📚 Extracting references from document...")
-        
-        try:
-            extraction_prompt = f"""
+    def _build_extraction_prompt(self, document_text: str) -> str:
+        """Build the LLM prompt for reference extraction."""
+        return f"""
 Extract ALL references/citations from this academic document.
 
 For each reference, identify:
@@ -52,40 +190,106 @@ Do not extract in-text citations.
 Document text (last 8000 chars, likely containing references):
 {document_text[-8000:]}
 """
+    
+    async def _start_stream(self, prompt: str) -> Tuple[Optional[str], AsyncIterator[str]]:
+        """
+        Open the LLM stream and wait for its first chunk.
+        
+        Transient provider errors (rate limits, timeouts) are retried with jittered
+        exponential backoff. Only the opening of the stream is retried, so no
+        reference is ever yielded twice.
+        
+        Returns:
+            Tuple of (first chunk or None if the stream is empty, remaining stream)
+        """
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(3),
+            wait=wait_random_exponential(min=1, max=10),
+            retry=retry_if_exception_type(self.provider.transient_errors),
+            reraise=True,
+        ):
+            with attempt:
+                stream = self.provider.generate_simple_stream(prompt, temperature=0.1)
+                try:
+                    return await anext(stream), stream
+                except StopAsyncIteration:
+                    return None, stream
+    
+    async def stream_references(self, document_text: str) -> AsyncIterator[Dict[str, str]]:
+        """
+        Extract references using a streamed LLM response.
+        
+        Each reference is yielded as soon as its JSON object is complete, so
+        validation can start before the LLM finishes generating the list.
+        
+        Args:
+            document_text: Full document text
             
-            logger.debug("📤 LLM REQUEST: Reference extraction")
-            response = await self.provider.generate_simple(extraction_prompt, temperature=0.1)
-            logger.info("📥 LLM RESPONSE: References extracted")
-            
-            # Parse JSON response
-            text = response.strip()
+        Yields:
+            Reference dictionaries with parsed components
+        """
+        logger.info("📚 Extracting references from document...")
+        
+        parser = _JsonArrayStream()
+        count = 0
+        
+        try:
+            extraction_prompt = self._build_extraction_prompt(document_text)
             
-            # Extract JSON from markdown code blocks if present
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
+            logger.debug("📤 LLM REQUEST: Reference extraction (streaming)")
+            first_chunk, stream = await self._start_stream(extraction_prompt)
+            if first_chunk is not None:
+                for item in parser.feed(first_chunk):
+                    if isinstance(item, dict):
+                        count += 1
+                        yield item
+            async for chunk in stream:
+                for item in parser.feed(chunk):
+                    if isinstance(item, dict):
+                        count += 1
+                        yield item
+            logger.info("📥 LLM RESPONSE: References extracted")
             
-            references = json.loads(text)
-            logger.info(f"✅ Extracted {len(references)} references")
+            if not parser.finished:
+                raise ValueError("LLM response did not contain a complete JSON array")
             
-            return references
+            logger.info(f"✅ Extracted {count} references")
         
         except Exception as e:
             logger.error(f"❌ Error extracting references: {str(e)}")
-            # Fallback: try regex-based extraction
-            return self._fallback_extraction(document_text)
+            # Fallback: try regex-based extraction if nothing was parsed
+            if count == 0:
+                for reference in self._fallback_extraction(document_text):
+                    yield reference
+            else:
+                logger.warning(f"⚠️ Keeping {count} references parsed before the error")
+    
+    async def extract_references(self, document_text: str) -> List[Dict[str, str]]:
+        """
+        Extract all references from a document using LLM.
+        
+        Args:
+            document_text: Full document text
+            
+        Returns:
+            List of reference dictionaries with parsed components
+        """
+        return [reference async for reference in self.stream_references(document_text)]
     
     def _fallback_extraction(self, document_text: str) -> List[Dict[str, str]]:
         """Fallback regex-based reference extraction."""
         logger.info("⚠️ Using fallback regex extraction")
         
         references = []
-        # Simple DOI extraction
-        doi_pattern = r'10\.\d{4,}/[^\s]+'
-        dois = re.findall(doi_pattern, document_text[-8000:])
-        
-        for doi in dois[:20]:  # Limit to 20 references
+        seen = set()
+        # Simple DOI extraction; stop scanning once enough unique DOIs are found
+        for match in _DOI_IN_TEXT_RE.finditer(document_text, max(0, len(document_text) - 8000)):
+            if len(references) == _FALLBACK_MAX_REFERENCES:
+                break
+            doi = _clean_doi(match.group())
+            if doi in seen:
+                continue
+            seen.add(doi)
             references.append({
                 'citation_text': f"Reference with DOI: {doi}",
                 'title': '',
@@ -104,22 +308,60 @@ class ReferenceValidator:
     """Validate references against academic databases."""
     
     def __init__(self):
-        self.semantic_scholar = SemanticScholarAPI()
-        self.crossref = CrossRefAPI()
-        self.rate_limiter = RateLimiter(calls_per_second=2.0)
+        self.semantic_scholar = get_semantic_scholar()
+        self.crossref = get_crossref()
+        # Shared per-host limiters, so the two APIs do not throttle each other
+        self.s2_limiter = get_host_limiter(self.semantic_scholar.BASE_URL)
+        self.crossref_limiter = get_host_limiter(self.crossref.BASE_URL)
+        # One lookup per DOI, shared by every reference citing it
+        self._doi_lookups: Dict[str, asyncio.Task] = {}
     
-    async def validate_reference(self, reference: Dict[str, str]) -> Dict[str, Any]:
+    async def prefetch_dois(self, dois: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Look up many DOIs on Semantic Scholar in batch requests.
+        
+        Args:
+            dois: DOIs to look up
+            
+        Returns:
+            Mapping of DOI to paper metadata, or to None for DOIs Semantic
+            Scholar does not know; DOIs whose lookup failed are left out
+        """
+        if not dois:
+            return {}
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.semantic_scholar.get_papers_by_dois, dois)
+    
+    async def validate_reference(
+        self,
+        reference: Dict[str, str],
+        check_url: bool = True,
+        prefetched: Optional[Dict[str, Any]] = None,
+        prefetch_done: bool = False,
+        normalized: Optional[_NormalizedReference] = None
+    ) -> Dict[str, Any]:
         """
         Validate a single reference.
         
         Args:
             reference: Reference dictionary with parsed components
+            check_url: Whether to check URL accessibility here (disable when
+                URLs are checked in a batch with check_urls())
+            prefetched: Semantic Scholar metadata already fetched for the
+                reference's DOI (see prefetch_dois()), if any
+            prefetch_done: Whether Semantic Scholar already answered for the
+                DOI, so a missing prefetched paper goes straight to CrossRef
+            normalized: The reference's _normalize_reference() fields, if
+                already computed
             
         Returns:
             Validation result with status, matched metadata, and issues
         """
         logger.debug(f"🔍 Validating: {reference.get('title', 'Unknown')[:50]}...")
         
+        if normalized is None:
+            normalized = _normalize_reference(reference)
+        
         result = {
             'original_reference': reference,
             'validation_status': 'Unknown',
@@ -132,29 +374,47 @@ class ReferenceValidator:
         }
         
         # Step 1: Validate DOI if present
-        if reference.get('doi'):
-            await asyncio.sleep(self.rate_limiter.wait_time())
-            doi_result = await self._validate_doi(reference['doi'], reference)
+        if normalized.doi:
+            doi_result = await self._validate_doi(normalized, prefetched, prefetch_done)
             result.update(doi_result)
         
-        # Step 2: If no DOI or DOI validation failed, try title search
+        # Step 2: If no usable DOI, try title search
         elif reference.get('title'):
-            await asyncio.sleep(self.rate_limiter.wait_time())
-            title_result = await self._validate_by_title(reference)
+            title_result = await self._validate_by_title(reference, normalized)
             result.update(title_result)
         
-        # Step 3: Check URL accessibility
-        if reference.get('url'):
+        if normalized.malformed_doi:
+            result['issues'].insert(0, f"Malformed DOI: {reference['doi']}")
+        
+        # Step 3: Check URL accessibility (skipped when already implied by the match)
+        if self._url_check_implied(result):
+            result['url_accessible'] = True
+        elif check_url and reference.get('url'):
             url_status = await self._check_url(reference['url'])
             result['url_accessible'] = url_status
         
+        # Slow down if CrossRef advertises a lower rate limit than ours
+        if self.crossref.rate_limit and self.crossref.rate_limit < self.crossref_limiter.rate:
+            self.crossref_limiter.set_rate(self.crossref.rate_limit)
+        
         # Determine final validation status
         result['validation_status'] = self._determine_status(result)
         
         return result
     
-    async def _validate_doi(self, doi: str, reference: Dict[str, str]) -> Dict[str, Any]:
-        """Validate reference by DOI."""
+    async def _validate_doi(
+        self,
+        normalized: _NormalizedReference,
+        paper: Optional[Dict[str, Any]] = None,
+        prefetch_done: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate reference by DOI, using prefetched Semantic Scholar metadata if given.
+        
+        When prefetch_done is set and no paper was prefetched, Semantic Scholar
+        does not know the DOI, so only CrossRef is asked.
+        """
+        doi = normalized.doi
         result = {
             'doi_verified': False,
             'matched_metadata': None,
@@ -162,30 +422,20 @@ class ReferenceValidator:
             'metadata_match': False
         }
         
-        # Run API calls in executor
-        loop = asyncio.get_event_loop()
-        
-        # Try Semantic Scholar first
-        paper = await loop.run_in_executor(
-            None,
-            lambda: self.semantic_scholar.get_paper_by_doi(doi)
-        )
-        
-        # If not found, try CrossRef
-        if not paper:
-            crossref_data = await loop.run_in_executor(
-                None,
-                lambda: self.crossref.get_by_doi(doi)
-            )
-            if crossref_data:
-                paper = self._convert_crossref_to_standard(crossref_data)
+        if paper is None:
+            lookup = self._doi_lookups.get(doi)
+            if lookup is None:
+                lookup = self._doi_lookups[doi] = asyncio.create_task(
+                    self._lookup_doi(doi, skip_semantic_scholar=prefetch_done)
+                )
+            paper = await asyncio.shield(lookup)
         
         if paper:
             result['doi_verified'] = True
             result['matched_metadata'] = paper
             
             # Check metadata consistency
-            metadata_issues = self._compare_metadata(reference, paper)
+            metadata_issues = self._compare_metadata(normalized, paper)
             result['issues'].extend(metadata_issues)
             result['metadata_match'] = len(metadata_issues) == 0
         
@@ -195,7 +445,33 @@ class ReferenceValidator:
         
         return result
     
-    async def _validate_by_title(self, reference: Dict[str, str]) -> Dict[str, Any]:
+    async def _lookup_doi(self, doi: str, skip_semantic_scholar: bool = False) -> Optional[Dict[str, Any]]:
+        """Look up a DOI on Semantic Scholar (unless it already missed there), then CrossRef."""
+        # Run API calls in executor
+        loop = asyncio.get_event_loop()
+        
+        # Try Semantic Scholar first
+        paper = None
+        if not skip_semantic_scholar:
+            async with self.s2_limiter:
+                paper = await loop.run_in_executor(
+                    None,
+                    lambda: self.semantic_scholar.get_paper_by_doi(doi)
+                )
+        
+        # If not found, try CrossRef
+        if not paper:
+            async with self.crossref_limiter:
+                crossref_data = await loop.run_in_executor(
+                    None,
+                    lambda: self.crossref.get_by_doi(doi)
+                )
+            if crossref_data:
+                paper = self._convert_crossref_to_standard(crossref_data)
+        
+        return paper
+    
+    async def _validate_by_title(self, reference: Dict[str, str], normalized: _NormalizedReference) -> Dict[str, Any]:
         """Validate reference by title search."""
         result = {
             'matched_metadata': None,
@@ -209,20 +485,21 @@ class ReferenceValidator:
             return result
         
         # Try CrossRef search
-        author = reference.get('authors', '').split(',')[0] if reference.get('authors') else None
+        author = normalized.first_author or None
         
         # Run API call in executor
         loop = asyncio.get_event_loop()
-        crossref_match = await loop.run_in_executor(
-            None,
-            lambda: self.crossref.search_by_title(title, author)
-        )
+        async with self.crossref_limiter:
+            crossref_match = await loop.run_in_executor(
+                None,
+                lambda: self.crossref.search_by_title(title, author)
+            )
         
         if crossref_match:
             result['matched_metadata'] = self._convert_crossref_to_standard(crossref_match)
             
             # Check metadata consistency
-            metadata_issues = self._compare_metadata(reference, result['matched_metadata'])
+            metadata_issues = self._compare_metadata(normalized, result['matched_metadata'])
             result['issues'].extend(metadata_issues)
             result['metadata_match'] = len(metadata_issues) == 0
         
@@ -232,12 +509,12 @@ class ReferenceValidator:
         
         return result
     
-    def _compare_metadata(self, reference: Dict[str, str], matched: Dict[str, Any]) -> List[str]:
-        """Compare reference metadata with database match."""
+    def _compare_metadata(self, normalized: _NormalizedReference, matched: Dict[str, Any]) -> List[str]:
+        """Compare normalized reference metadata with database match."""
         issues = []
         
         # Compare title (fuzzy match)
-        ref_title = reference.get('title', '').lower().strip()
+        ref_title_tokens = normalized.title_tokens
         matched_title = ''
         
         if isinstance(matched.get('title'), list):
@@ -245,50 +522,93 @@ class ReferenceValidator:
         else:
             matched_title = str(matched.get('title', '')).lower().strip()
         
-        if ref_title and matched_title:
+        if ref_title_tokens and matched_title:
             # Simple similarity check
-            common_words = set(ref_title.split()) & set(matched_title.split())
-            similarity = len(common_words) / max(len(ref_title.split()), len(matched_title.split()))
+            matched_title_tokens = set(matched_title.split())
+            common_words = ref_title_tokens & matched_title_tokens
+            similarity = len(common_words) / max(len(ref_title_tokens), len(matched_title_tokens))
             
             if similarity < 0.5:
                 issues.append(f"Title mismatch (similarity: {similarity:.0%})")
         
         # Compare year
-        ref_year = reference.get('year', '')
+        ref_year = normalized.year
         matched_year = str(matched.get('year', ''))
         
         if ref_year and matched_year and ref_year != matched_year:
             issues.append(f"Year mismatch: cited {ref_year}, actual {matched_year}")
         
-        # Compare authors (basic check)
-        ref_authors = reference.get('authors', '').lower()
-        matched_authors = ''
-        
-        if 'authors' in matched and matched['authors']:
-            if isinstance(matched['authors'], list):
-                matched_authors = ' '.join([a.get('name', '') for a in matched['authors']]).lower()
-            else:
-                matched_authors = str(matched['authors']).lower()
+        # Compare authors (basic check) by last name
+        ref_author_list = normalized.authors
+        matched_last_names = self._matched_last_names(matched.get('authors'))
         
-        if ref_authors and matched_authors:
-            # Check if any author name appears
-            ref_author_list = [a.strip() for a in ref_authors.split(',')]
-            if ref_author_list and not any(author in matched_authors for author in ref_author_list[:2]):
+        if ref_author_list and matched_last_names:
+            # Check if any of the first cited authors appears
+            ref_last_names = [author.split()[-1].strip('.') for author in ref_author_list[:2]]
+            if not any(last_name in matched_last_names for last_name in ref_last_names):
                 issues.append("Author mismatch detected")
         
         return issues
     
+    def _matched_last_names(self, authors: Any) -> set:
+        """Build a set of lowercased author last names from database metadata."""
+        if not authors:
+            return set()
+        if not isinstance(authors, list):
+            authors = [{'name': name} for name in str(authors).split(',')]
+        
+        last_names = set()
+        for author in authors:
+            # Semantic Scholar uses 'name'; CrossRef uses 'given'/'family'
+            name = (author.get('family') or author.get('name', '')) if isinstance(author, dict) else str(author)
+            tokens = name.lower().split()
+            if tokens:
+                last_names.add(tokens[-1].strip('.'))
+        return last_names
+    
+    def _url_check_implied(self, result: Dict[str, Any]) -> bool:
+        """
+        Return True when URL accessibility follows from the validation result.
+        
+        A resolved DOI implies a canonical, reachable URL, as does a cited URL
+        identical to the one in the matched database record.
+        """
+        if result.get('doi_verified'):
+            return True
+        
+        cited_url = result['original_reference'].get('url')
+        matched_url = (result.get('matched_metadata') or {}).get('url')
+        return bool(cited_url and matched_url) and _normalize_url(cited_url) == _normalize_url(matched_url)
+    
     async def _check_url(self, url: str) -> bool:
         """Check if URL is accessible."""
-        try:
-            import requests
+        # Run synchronous request in executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_URL_CHECK_EXECUTOR, self._check_url_sync, url)
+    
+    async def check_urls(self, urls: List[str]) -> List[bool]:
+        """
+        Check accessibility of many URLs concurrently.
+        
+        Args:
+            urls: URLs to check
             
-            # Run synchronous request in executor
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.head(url, timeout=5, allow_redirects=True)
-            )
+        Returns:
+            Accessibility flags in the same order as urls
+        """
+        if not urls:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(_URL_CHECK_EXECUTOR, self._check_url_sync, url)
+            for url in urls
+        )))
+    
+    def _check_url_sync(self, url: str) -> bool:
+        """Blocking URL accessibility check via a HEAD request."""
+        try:
+            response = _head(url)
             
             accessible = response.status_code < 400
             if accessible:
@@ -345,8 +665,40 @@ async def validate_all_references(
     extractor = ReferenceExtractor(provider)
     validator = ReferenceValidator()
     
-    # Extract references
-    references = await extractor.extract_references(document_text)
+    # Start validating references without a DOI as soon as the LLM has streamed them;
+    # DOIs are collected and resolved together with batch lookups afterwards
+    references = []
+    normalized = []
+    tasks = []
+    doi_slots = []
+    async for ref in extractor.stream_references(document_text):
+        norm = _normalize_reference(ref)
+        references.append(ref)
+        normalized.append(norm)
+        if norm.doi:
+            doi_slots.append(len(tasks))
+            tasks.append(None)
+        else:
+            tasks.append(asyncio.create_task(validator.validate_reference(ref, check_url=False, normalized=norm)))
+    
+    if doi_slots:
+        try:
+            # Duplicate citations of the same DOI share one lookup
+            papers = await validator.prefetch_dois(list(dict.fromkeys(normalized[i].doi for i in doi_slots)))
+        except BaseException:
+            for task in tasks:
+                if task is not None:
+                    task.cancel()
+            raise
+        for i in doi_slots:
+            doi = normalized[i].doi
+            # DOIs missing from papers failed the batch lookup and are retried one by one
+            tasks[i] = asyncio.create_task(
+                validator.validate_reference(
+                    references[i], check_url=False, prefetched=papers.get(doi), prefetch_done=doi in papers,
+                    normalized=normalized[i]
+                )
+            )
     
     if not references:
         logger.warning("⚠️ No references extracted")
@@ -358,25 +710,47 @@ async def validate_all_references(
                 'verified': 0,
                 'with_issues': 0,
                 'failed': 0,
-                'unverifiable': 0
+                'unverifiable': 0,
+                'malformed_dois': 0
             }
         }
     
-    # Validate each reference
-    validation_results = []
-    for i, ref in enumerate(references, 1):
-        logger.info(f"📋 Validating reference {i}/{len(references)}...")
-        result = await validator.validate_reference(ref)
-        validation_results.append(result)
+    # Report progress as validations complete, in any order
+    try:
+        for i, completed in enumerate(asyncio.as_completed(tasks), 1):
+            result = await completed
+            logger.info(f"📋 Validated reference {i}/{len(tasks)}: {result['validation_status']}")
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    
+    # Keep results in document order
+    validation_results = [task.result() for task in tasks]
+    
+    # Check all URLs in one concurrent batch instead of one round-trip per reference
+    url_results = [
+        r for r in validation_results
+        if r['original_reference'].get('url') and not validator._url_check_implied(r)
+    ]
+    if url_results:
+        logger.info(f"🔍 Checking accessibility of {len(url_results)} URLs...")
+        statuses = await validator.check_urls([r['original_reference']['url'] for r in url_results])
+        for result, accessible in zip(url_results, statuses):
+            result['url_accessible'] = accessible
     
     # Generate summary
     summary = {
         'verified': sum(1 for r in validation_results if r['validation_status'] == '✅ Verified'),
         'with_issues': sum(1 for r in validation_results if '⚠️' in r['validation_status']),
         'failed': sum(1 for r in validation_results if '❌' in r['validation_status']),
-        'unverifiable': sum(1 for r in validation_results if '❓' in r['validation_status'])
+        'unverifiable': sum(1 for r in validation_results if '❓' in r['validation_status']),
+        'malformed_dois': sum(1 for norm in normalized if norm.malformed_doi)
     }
     
+    if summary['malformed_dois']:
+        logger.warning(f"⚠️ Skipped lookup of {summary['malformed_dois']} malformed DOIs")
+    
     logger.info(f"✅ Reference validation complete: {summary['verified']} verified, {summary['with_issues']} with issues, {summary['failed']} failed")
     
     return {
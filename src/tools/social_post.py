@@ -26,6 +26,7 @@ Requirements:
 
 async def write_social_media_post(
     explanation: str,
+    *,
     provider: BaseLLMProvider
 ) -> str:
     """
@@ -3,15 +3,27 @@ Advanced Source Verification Tool - Refactored with async and provider abstracti
 Coordinates reference validation and claim verification pipelines.
 """
 
+import asyncio
 from typing import Dict, Any
 from src.logging import logger
 from src.providers.base import BaseLLMProvider
+from src.utils.api_clients import get_semantic_scholar, get_crossref
 from src.tools.reference_validator import validate_all_references
 from src.tools.claim_verifier import verify_all_claims
 
 
+async def ensure_ready() -> None:
+    """Warm up the Semantic Scholar and CrossRef connections ahead of a verification request."""
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        loop.run_in_executor(None, get_semantic_scholar().warm_up),
+        loop.run_in_executor(None, get_crossref().warm_up),
+    )
+
+
 async def verify_document_sources(
     document_text: str,
+    *,
     provider: BaseLLMProvider,
     verify_claims: bool = True,
     verify_references: bool = True
@@ -121,6 +133,8 @@ def _generate_verification_report(results: Dict[str, Any]) -> str:
             report_lines.append(f"  ⚠️  With Issues:          {summary.get('with_issues', 0)}")
             report_lines.append(f"  ❌ Validation Failed:     {summary.get('failed', 0)}")
             report_lines.append(f"  ❓ Could Not Verify:      {summary.get('unverifiable', 0)}")
+            if summary.get('malformed_dois'):
+                report_lines.append(f"  🚫 Malformed DOIs:        {summary['malformed_dois']}")
             report_lines.append("")
             
             # Detailed reference results
@@ -241,7 +255,7 @@ async def quick_verify_references(
     logger.info("🔍 Quick reference verification (claims skipped)")
     return await verify_document_sources(
         document_text,
-        provider,
+        provider=provider,
         verify_claims=False,
         verify_references=True
     )
@@ -264,7 +278,7 @@ async def quick_verify_claims(
     logger.info("🔍 Quick claim verification (references skipped)")
     return await verify_document_sources(
         document_text,
-        provider,
+        provider=provider,
         verify_claims=True,
         verify_references=False
     )
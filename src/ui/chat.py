@@ -5,16 +5,83 @@ Agentic loop with tool calling and multimodal support.
 
 import json
 import asyncio
-import google.generativeai as genai
-from typing import Dict, Any, List
-from src.config import MAX_ITERATIONS, MAX_FUNCTION_ARG_LENGTH
+import functools
+from typing import Dict, Any, List, Optional, AsyncIterator
+from src.config import MAX_ITERATIONS, MAX_FUNCTION_ARG_LENGTH, TOOL_CONCURRENCY, TOOL_TIMEOUT
 from src.logging import logger
 from src.providers.gemini import GeminiProvider
-from src.providers.base import Message, MessageRole, Tool, FunctionCall
-from src.utils import get_async_function_map, get_tool_schemas
+from src.providers.base import Message, MessageRole, Tool, FunctionCall, LLMResponse
+from src.utils import get_async_function_map, upload_file_cached
+from src.utils.tool_registry import TOOL_SPECS
 
 
-async def chat(message: Any, history: List) -> str:
+# System instruction to present tool results properly
+SYSTEM_INSTRUCTION = """You are a research assistant. When you use tools and get results, present the COMPLETE results to the user clearly and directly.
+
+IMPORTANT:
+- For paper searches: Show ALL papers with their full details (titles, authors, dates, summaries, URLs)
+- For explanations: Present the complete explanation
+- For any tool output: Show the full results without summarizing or asking "what do you want to do next?"
+- Let the user see all the information, then they can ask follow-up questions if needed"""
+
+# Shared provider, created once on first use
+_provider: Optional[GeminiProvider] = None
+_lock = asyncio.Lock()
+
+# Bounds how many tool calls run at once, however many the model asks for
+_TOOL_SEM = asyncio.Semaphore(TOOL_CONCURRENCY)
+
+
+async def _get_provider() -> GeminiProvider:
+    """Get the shared Gemini provider, creating it on first use."""
+    global _provider
+    if _provider is None:
+        async with _lock:
+            if _provider is None:
+                from src.config import GEMINI_API_KEY, GEMINI_MODEL_NAME
+                _provider = GeminiProvider(api_key=GEMINI_API_KEY, model_name=GEMINI_MODEL_NAME)
+    return _provider
+
+
+def _is_oversized(value: Any) -> bool:
+    """Return True for string arguments too long to pass to a tool."""
+    return isinstance(value, str) and len(value) > MAX_FUNCTION_ARG_LENGTH
+
+
+class _LazyJson:
+    """Serialize an object for a log message only if the message is emitted."""
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return json.dumps(self.obj, ensure_ascii=False)[:200]
+
+
+async def _run_tool(coro) -> str:
+    """Run one tool call within the concurrency limit and timeout."""
+    async with _TOOL_SEM:
+        try:
+            return await asyncio.wait_for(coro, timeout=TOOL_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"timed out after {TOOL_TIMEOUT}s")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tools() -> List[Tool]:
+    """Convert the registered tool specs to Tool objects once (with plain-dict parameters for genai)."""
+    return [
+        Tool(
+            name=spec.name,
+            description=spec.description,
+            parameters=spec.parameters
+        )
+        for spec in TOOL_SPECS
+    ]
+
+
+async def chat(message: Any, history: List) -> AsyncIterator[str]:
     """
     Agentic chat function with tool calling and file support.
     
@@ -22,8 +89,8 @@ async def chat(message: Any, history: List) -> str:
         message: User message (string or dict with text and files)
         history: Chat history (currently unused, but kept for Gradio compatibility)
         
-    Returns:
-        str: Assistant's response
+    Yields:
+        str: Assistant's response so far, growing as it streams in
     """
     # Handle both string messages and multimodal messages with files
     if isinstance(message, dict):
@@ -42,219 +109,66 @@ async def chat(message: Any, history: List) -> str:
     logger.info("="*80)
     
     try:
-        # Initialize provider
-        import os
-        from src.config import GEMINI_API_KEY, GEMINI_MODEL_NAME
-        provider = GeminiProvider(api_key=GEMINI_API_KEY, model_name=GEMINI_MODEL_NAME)
+        # Get the shared provider
+        provider = await _get_provider()
         
-        # Get async function map and tool schemas
+        # Get async function map
         function_map = get_async_function_map(provider)
-        tool_schemas = get_tool_schemas()
         
-        # Prepare the message content
-        message_parts = []
+        # Uploaded file references attached to the user message
+        uploaded_files = []
         
         # Add uploaded files (PDFs, images, etc.) to the message
         if files:
-            for file_path in files:
+            # Upload all files to Gemini concurrently (reusing earlier uploads);
+            # the first failure cancels the uploads still in flight
+            upload_tasks = [asyncio.create_task(upload_file_cached(file_path)) for file_path in files]
+            done, pending = await asyncio.wait(upload_tasks, return_when=asyncio.FIRST_EXCEPTION)
+            
+            if pending:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            
+            # Collect the results in the original order
+            for file_path, task in zip(files, upload_tasks):
                 logger.debug(f"📎 Processing file: {file_path}")
-                try:
-                    # Upload file to Gemini
-                    uploaded_file = genai.upload_file(file_path)
-                    logger.info(f"✅ File uploaded to Gemini: {uploaded_file.name}")
-                    message_parts.append(uploaded_file)
-                except Exception as e:
-                    logger.error(f"❌ Error uploading file {file_path}: {str(e)}")
-                    return f"Error uploading file: {str(e)}"
+                if task.cancelled():
+                    continue
+                if task.exception() is not None:
+                    logger.error(f"❌ Error uploading file {file_path}: {str(task.exception())}")
+                    yield f"Error uploading file: {str(task.exception())}"
+                    return
+                uploaded_file = task.result()
+                logger.info(f"✅ File uploaded to Gemini: {uploaded_file.name}")
+                uploaded_files.append(uploaded_file)
         
-        # Add the text message
-        if user_message:
-            message_parts.append(user_message)
-        
-        # If no message parts, return error
-        if not message_parts:
-            return "Please provide a message or upload a file."
-        
-        # For multimodal messages with files, use Gemini's native API
-        # (Provider abstraction doesn't support file uploads yet)
-        if files:
-            return await _handle_multimodal_message(message_parts, function_map, tool_schemas)
+        # If no text and no files, return error
+        if not user_message and not uploaded_files:
+            yield "Please provide a message or upload a file."
+            return
         
-        # For text-only messages, use provider abstraction
-        return await _handle_text_message(user_message, provider, function_map, tool_schemas)
+        async for partial in _handle_message(user_message, provider, function_map, uploaded_files):
+            yield partial
     
     except Exception as e:
         logger.error(f"❌ ERROR in chat function: {str(e)}")
         logger.info("="*80)
-        return f"Error: {str(e)}"
-
-
-async def _handle_multimodal_message(
-    message_parts: List,
-    function_map: Dict,
-    tool_schemas: List[Dict]
-) -> str:
-    """Handle messages with file attachments using Gemini's native API."""
-    from src.models import get_model_with_tools
-    from src.utils import tools
-    from src.config import GEMINI_MODEL_NAME
-
-    # System instruction to present tool results properly
-    system_instruction = """You are a research assistant. When you use tools and get results, present the COMPLETE results to the user clearly and directly.
-
-IMPORTANT:
-- For paper searches: Show ALL papers with their full details (titles, authors, dates, summaries, URLs)
-- For explanations: Present the complete explanation
-- For any tool output: Show the full results without summarizing or asking "what do you want to do next?"
-- Let the user see all the information, then they can ask follow-up questions if needed"""
+        yield f"Error: {str(e)}"
 
-    # Initialize model with tools AND system instruction
-    model = genai.GenerativeModel(
-        model_name=GEMINI_MODEL_NAME,
-        tools=tools,
-        system_instruction=system_instruction
-    )
 
-    # Start a chat session
-    logger.debug("🔧 Starting new chat session (multimodal) with system instruction")
-    chat_session = model.start_chat(history=[])
-    
-    # Send the message (with files)
-    logger.debug("📤 LLM REQUEST: Sending multimodal message to Gemini")
-    
-    # Run synchronous API call in executor
-    loop = asyncio.get_event_loop()
-    response = await loop.run_in_executor(
-        None,
-        lambda: chat_session.send_message(message_parts)
-    )
-    logger.debug("📥 LLM RESPONSE: Received response from Gemini")
-    
-    # Handle tool calls in a loop
-    iteration = 0
-    
-    while iteration < MAX_ITERATIONS:
-        iteration += 1
-        logger.debug(f"🔄 AGENTIC LOOP: Iteration {iteration}")
-        
-        # Check if response is valid
-        if not response.candidates or not response.candidates[0].content.parts:
-            logger.debug("⚠️  No candidates or parts in response")
-            break
-        
-        # Check for finish reason issues
-        candidate = response.candidates[0]
-        if hasattr(candidate, 'finish_reason'):
-            finish_reason = str(candidate.finish_reason)
-            if 'MALFORMED' in finish_reason:
-                logger.warning(f"⚠️  Malformed function call detected: {finish_reason}")
-                # Try to extract any text response that might exist
-                if hasattr(candidate.content, 'parts'):
-                    for part in candidate.content.parts:
-                        if hasattr(part, 'text') and part.text:
-                            logger.info(f"💭 Recovered partial response ({len(part.text)} chars)")
-                            return part.text
-                return "I encountered an issue processing the function call. Please try rephrasing your request."
-        
-        part = candidate.content.parts[0]
-        
-        # Check if there's a function call
-        if hasattr(part, "function_call") and part.function_call:
-            function_call = part.function_call
-            function_name = function_call.name
-            
-            try:
-                function_args = dict(function_call.args)
-            except Exception as e:
-                logger.error(f"❌ ERROR parsing function arguments: {str(e)}")
-                return "I encountered an issue with the function call format. Please try again."
-            
-            logger.info(f"🛠️  TOOL CALL REQUESTED: {function_name}")
-            logger.debug(f"  Arguments: {json.dumps(function_args, ensure_ascii=False)[:200]}")
-            
-            # Execute the function
-            if function_name in function_map:
-                try:
-                    # Truncate very long arguments to prevent issues
-                    for key, value in function_args.items():
-                        if isinstance(value, str) and len(value) > MAX_FUNCTION_ARG_LENGTH:
-                            logger.warning(f"⚠️  Truncating {key} from {len(value)} to {MAX_FUNCTION_ARG_LENGTH} chars")
-                            function_args[key] = value[:MAX_FUNCTION_ARG_LENGTH] + "\n\n[Truncated due to length...]"
-                    
-                    logger.info(f"⚙️  EXECUTING TOOL: {function_name}")
-                    result = await function_map[function_name](**function_args)
-                    result_preview = result[:150] if len(result) > 150 else result
-                    logger.info(f"✅ TOOL EXECUTION COMPLETE: {function_name}")
-                    logger.debug(f"  Result preview: {result_preview}...")
-                    
-                    # Send function response back to model
-                    logger.debug("📤 LLM REQUEST: Sending tool result back to Gemini")
-                    response = await loop.run_in_executor(
-                        None,
-                        lambda: chat_session.send_message({
-                            "function_response": {
-                                "name": function_name,
-                                "response": {"result": result},
-                            }
-                        })
-                    )
-                    logger.debug("📥 LLM RESPONSE: Received response after tool execution")
-                except Exception as e:
-                    logger.error(f"❌ ERROR executing function: {str(e)}")
-                    return f"Error executing {function_name}: {str(e)}"
-            else:
-                logger.error(f"❌ ERROR: Unknown function '{function_name}'")
-                return f"Unknown function: {function_name}"
-        
-        # Check if there's text response
-        elif hasattr(part, "text") and part.text:
-            logger.info(f"💭 FINAL RESPONSE: Generated text response ({len(part.text)} chars)")
-            logger.debug(f"  Preview: {part.text[:200]}...")
-            logger.info("="*80)
-            return part.text
-        else:
-            logger.debug("⚠️  No more parts to process, breaking loop")
-            break
-    
-    # If we exit the loop without returning, get the final text
-    if response.text:
-        logger.info(f"💭 FINAL RESPONSE: Generated text response ({len(response.text)} chars)")
-        logger.info("="*80)
-        return response.text
-    else:
-        logger.warning("⚠️  No response text generated")
-        logger.info("="*80)
-        return "I processed your request but didn't generate a response."
-
-
-async def _handle_text_message(
+async def _handle_message(
     user_message: str,
     provider: GeminiProvider,
     function_map: Dict,
-    tool_schemas: List[Dict]
-) -> str:
-    """Handle text-only messages using provider abstraction."""
-    # Convert tool schemas to Tool objects
-    tools = []
-    for schema in tool_schemas:
-        tools.append(Tool(
-            name=schema["name"],
-            description=schema["description"],
-            parameters=schema["parameters"]
-        ))
-
-    # System instruction
-    system_instruction = """You are a research assistant. When you use tools and get results, present the COMPLETE results to the user clearly and directly.
-
-IMPORTANT:
-- For paper searches: Show ALL papers with their full details (titles, authors, dates, summaries, URLs)
-- For explanations: Present the complete explanation
-- For any tool output: Show the full results without summarizing or asking "what do you want to do next?"
-- Let the user see all the information, then they can ask follow-up questions if needed"""
+    files: Optional[List[Any]] = None
+) -> AsyncIterator[str]:
+    """Run the agentic loop for a message (with optional file attachments), streaming the answer text."""
+    tools = _get_tools()
 
     # Create initial messages with system instruction
     messages = [
-        Message(role=MessageRole.SYSTEM, content=system_instruction),
+        Message(role=MessageRole.SYSTEM, content=SYSTEM_INSTRUCTION),
         Message(role=MessageRole.USER, content=user_message)
     ]
     
@@ -265,62 +179,114 @@ IMPORTANT:
         iteration += 1
         logger.debug(f"🔄 AGENTIC LOOP: Iteration {iteration}")
         
-        # Generate response with tools
-        logger.debug("📤 LLM REQUEST: Sending message to provider")
-        response = await provider.generate(
+        # Stream response with tools, showing text as soon as it arrives
+        logger.debug("📤 LLM REQUEST: Streaming message from provider")
+        response = LLMResponse(content="")
+        async for chunk in provider.generate_stream(
             messages=messages,
             temperature=0.7,
-            tools=tools
-        )
+            tools=tools,
+            files=files
+        ):
+            response.function_calls.extend(chunk.function_calls)
+            if chunk.finish_reason == "malformed_function_call":
+                response.finish_reason = chunk.finish_reason
+            if chunk.content:
+                response.content += chunk.content
+                # Once a function call arrives this turn is for tools, not the user
+                if not response.function_calls:
+                    yield response.content
         logger.debug("📥 LLM RESPONSE: Received response from provider")
         
+        # Check for finish reason issues
+        if response.finish_reason == "malformed_function_call":
+            logger.warning(f"⚠️  Malformed function call detected: {response.finish_reason}")
+            if response.content:
+                logger.info(f"💭 Recovered partial response ({len(response.content)} chars)")
+                yield response.content
+                return
+            yield "I encountered an issue processing the function call. Please try rephrasing your request."
+            return
+        
         # Check if there are function calls
         if response.function_calls:
+            # Phase 1: validate every requested name before creating any
+            # coroutine, so an unknown one leaves nothing un-awaited
+            for func_call in response.function_calls:
+                if func_call.name not in function_map:
+                    logger.error(f"❌ ERROR: Unknown function '{func_call.name}'")
+                    yield f"Unknown function: {func_call.name}"
+                    return
+            
+            # Then prepare every call
+            coros = []
+            names = []
             for func_call in response.function_calls:
                 function_name = func_call.name
                 function_args = func_call.arguments
                 
                 logger.info(f"🛠️  TOOL CALL REQUESTED: {function_name}")
-                logger.debug(f"  Arguments: {json.dumps(function_args, ensure_ascii=False)[:200]}")
+                logger.debug("  Arguments: %s", _LazyJson(function_args))
+                
+                # Truncate very long arguments (into a new dict, leaving the provider's intact)
+                if any(_is_oversized(value) for value in function_args.values()):
+                    for key, value in function_args.items():
+                        if _is_oversized(value):
+                            logger.warning(f"⚠️  Truncating {key} from {len(value)} to {MAX_FUNCTION_ARG_LENGTH} chars")
+                    function_args = {
+                        key: value[:MAX_FUNCTION_ARG_LENGTH] + "\n\n[Truncated due to length...]" if _is_oversized(value) else value
+                        for key, value in function_args.items()
+                    }
+                
+                logger.info(f"⚙️  EXECUTING TOOL: {function_name}")
+                try:
+                    coros.append(function_map[function_name](**function_args))
+                except Exception as e:
+                    for coro in coros:
+                        coro.close()
+                    logger.error(f"❌ ERROR executing function: {str(e)}")
+                    yield f"Error executing {function_name}: {str(e)}"
+                    return
+                names.append(function_name)
+            
+            # Phase 2: run the independent tool calls concurrently; a failing
+            # call cancels the others
+            tasks = []
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(_run_tool(coro)) for coro in coros]
+            except* Exception:
+                pass
+            
+            # Report the first failed call in the order they were requested
+            for function_name, task in zip(names, tasks):
+                if not task.cancelled() and task.exception() is not None:
+                    logger.error(f"❌ ERROR executing function: {str(task.exception())}")
+                    yield f"Error executing {function_name}: {str(task.exception())}"
+                    return
+            
+            # Add function results to messages in the order they were requested
+            for function_name, task in zip(names, tasks):
+                result = task.result()
+                logger.info(f"✅ TOOL EXECUTION COMPLETE: {function_name}")
+                logger.debug("  Result preview: %.150s...", result)
                 
-                # Execute the function
-                if function_name in function_map:
-                    try:
-                        # Truncate very long arguments
-                        for key, value in function_args.items():
-                            if isinstance(value, str) and len(value) > MAX_FUNCTION_ARG_LENGTH:
-                                logger.warning(f"⚠️  Truncating {key} from {len(value)} to {MAX_FUNCTION_ARG_LENGTH} chars")
-                                function_args[key] = value[:MAX_FUNCTION_ARG_LENGTH] + "\n\n[Truncated due to length...]"
-                        
-                        logger.info(f"⚙️  EXECUTING TOOL: {function_name}")
-                        result = await function_map[function_name](**function_args)
-                        result_preview = result[:150] if len(result) > 150 else result
-                        logger.info(f"✅ TOOL EXECUTION COMPLETE: {function_name}")
-                        logger.debug(f"  Result preview: {result_preview}...")
-                        
-                        # Add function result to messages
-                        messages.append(Message(
-                            role=MessageRole.FUNCTION,
-                            content=result,
-                            name=function_name
-                        ))
-                    except Exception as e:
-                        logger.error(f"❌ ERROR executing function: {str(e)}")
-                        return f"Error executing {function_name}: {str(e)}"
-                else:
-                    logger.error(f"❌ ERROR: Unknown function '{function_name}'")
-                    return f"Unknown function: {function_name}"
+                messages.append(Message(
+                    role=MessageRole.FUNCTION,
+                    content=result,
+                    name=function_name
+                ))
         
-        # Check if there's text response
+        # Check if there's text response (already streamed to the user)
         elif response.content:
             logger.info(f"💭 FINAL RESPONSE: Generated text response ({len(response.content)} chars)")
-            logger.debug(f"  Preview: {response.content[:200]}...")
+            logger.debug("  Preview: %.200s...", response.content)
             logger.info("="*80)
-            return response.content
+            return
         else:
             logger.debug("⚠️  No content or function calls, breaking loop")
             break
     
     logger.warning("⚠️  Max iterations reached or no response generated")
     logger.info("="*80)
-    return "I processed your request but didn't generate a response."
+    yield "I processed your request but didn't generate a response."
@@ -3,11 +3,17 @@ UI handlers for infographic generation functionality.
 """
 
 import os
-from src.tools import generate_paper_infographic
+import re
+from src.core.llm_provider import get_llm
+from src.tools import generate_paper_infographic, extract_text_from_pdf, PDFExtractionError
 from src.logging import logger
 
 
-def generate_infographic_from_text(paper_text: str) -> tuple[str, str]:
+# Path of the saved image inside the tool's success message
+_INFOGRAPHIC_PATH_RE = re.compile(r'generated_infographics[/\\][\w_]+\.jpg')
+
+
+async def generate_infographic_from_text(paper_text: str) -> tuple[str, str]:
     """
     Generate infographic from paper text input.
 
@@ -23,20 +29,12 @@ def generate_infographic_from_text(paper_text: str) -> tuple[str, str]:
     logger.info(f"🎨 UI REQUEST: Generate infographic from text ({len(paper_text)} chars)")
 
     try:
-        result = generate_paper_infographic(paper_text)
+        result = await generate_paper_infographic(paper_text, provider=get_llm())
 
         # Check if the result contains a file path
-        if "generated_infographics" in result:
-            # Extract the file path from the success message
-            for line in result.split('\n'):
-                if "Saved to:" in line or "generated_infographics" in line:
-                    # Find the path
-                    import re
-                    path_match = re.search(r'generated_infographics[/\\][\w_]+\.jpg', result)
-                    if path_match:
-                        filepath = path_match.group(0)
-                        if os.path.exists(filepath):
-                            return result, filepath
+        path_match = _INFOGRAPHIC_PATH_RE.search(result)
+        if path_match and os.path.exists(path_match.group(0)):
+            return result, path_match.group(0)
 
         # If no image was generated but we got a structured summary
         return result, None
@@ -46,7 +44,7 @@ def generate_infographic_from_text(paper_text: str) -> tuple[str, str]:
         return f"Error generating infographic: {str(e)}", None
 
 
-def generate_infographic_from_pdf(pdf_path_store: str) -> tuple[str, str]:
+async def generate_infographic_from_pdf(pdf_path_store: str) -> tuple[str, str]:
     """
     Generate infographic from uploaded PDF.
 
@@ -63,14 +61,13 @@ def generate_infographic_from_pdf(pdf_path_store: str) -> tuple[str, str]:
 
     try:
         # First extract text from the PDF
-        from src.tools import extract_text_from_pdf
-
-        paper_text = extract_text_from_pdf(pdf_path_store)
-        if paper_text.startswith("Error"):
-            return paper_text, None
+        try:
+            paper_text = await extract_text_from_pdf(pdf_path_store)
+        except PDFExtractionError as e:
+            return f"Error processing PDF: {str(e)}", None
 
         # Generate the infographic
-        return generate_infographic_from_text(paper_text)
+        return await generate_infographic_from_text(paper_text)
 
     except Exception as e:
         logger.error(f"❌ ERROR in generate_infographic_from_pdf: {str(e)}")
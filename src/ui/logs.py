@@ -3,6 +3,8 @@ Logs Tab Components and Handlers
 Provides log viewing, filtering, and management functionality.
 """
 
+import gradio as gr
+from typing import Any, Optional, Tuple
 from src.logging import log_buffer, logger
 
 
@@ -28,14 +30,21 @@ def clear_logs() -> str:
     return "✅ Logs cleared!"
 
 
-def refresh_logs() -> str:
+def refresh_logs(level: str = "INFO", last_version: Optional[int] = None) -> Tuple[Any, int]:
     """
-    Refresh the log display.
+    Refresh the log display, skipping the update when nothing has changed.
     
+    Args:
+        level: Log level currently selected (DEBUG, INFO, WARNING, ERROR)
+        last_version: Buffer version the client last rendered
+        
     Returns:
-        Current formatted logs
+        Current formatted logs (or a no-op update if unchanged) and the buffer version
     """
-    return log_buffer.format_logs("INFO")
+    version = log_buffer.version
+    if last_version == version:
+        return gr.update(), version
+    return log_buffer.format_logs(level), version
 
 
 def change_log_level(level: str) -> str:
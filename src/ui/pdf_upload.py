@@ -2,15 +2,22 @@
 PDF upload tab components and handlers.
 """
 
+from src.core.llm_provider import get_llm
 from src.logging import logger
-from src.tools import extract_text_from_pdf, process_uploaded_pdf, explain_research_paper, write_social_media_post
+from src.tools import (
+    extract_text_from_pdf,
+    process_uploaded_pdf_from_text,
+    explain_research_paper,
+    write_social_media_post,
+    PDFExtractionError,
+)
 
 
 # Global variable to store uploaded PDF path
 uploaded_pdf_path = {"path": None}
 
 
-def handle_pdf_upload(pdf_file):
+async def handle_pdf_upload(pdf_file):
     """Handle PDF file upload and store the path."""
     if pdf_file is None:
         return "No file uploaded.", ""
@@ -18,11 +25,11 @@ def handle_pdf_upload(pdf_file):
     logger.info(f"📄 PDF uploaded: {pdf_file.name}")
     uploaded_pdf_path["path"] = pdf_file.name
 
-    # Extract and preview text
-    preview_text = extract_text_from_pdf(pdf_file.name)
-
-    if preview_text.startswith("Error") or preview_text.startswith("PDF support"):
-        return preview_text, ""
+    # Extract just enough text for the preview; the full text is extracted on demand
+    try:
+        preview_text = await extract_text_from_pdf(pdf_file.name, max_chars=2048)
+    except PDFExtractionError as e:
+        return str(e), ""
 
     # Show preview (first 500 chars)
     preview = preview_text[:500] + "..." if len(preview_text) > 500 else preview_text
@@ -30,29 +37,40 @@ def handle_pdf_upload(pdf_file):
     return f"✅ PDF uploaded successfully!\n\n**Preview:**\n{preview}", pdf_file.name
 
 
-def analyze_uploaded_pdf(pdf_path):
-    """Analyze the uploaded PDF."""
+async def analyze_uploaded_pdf(pdf_path, text=None):
+    """Analyze the uploaded PDF, reusing already extracted text if given."""
     if not pdf_path:
         return "Please upload a PDF file first."
 
     logger.info(f"🔍 Analyzing uploaded PDF: {pdf_path}")
-    result = process_uploaded_pdf(pdf_path)
-    return result
+    if text is None:
+        try:
+            text = await extract_text_from_pdf(pdf_path)
+        except PDFExtractionError as e:
+            return str(e)
+    return await process_uploaded_pdf_from_text(text, get_llm())
 
 
-def explain_pdf(pdf_path):
+async def explain_pdf(pdf_path):
     """Generate detailed explanation of the uploaded PDF."""
     if not pdf_path:
         return "Please upload a PDF file first."
-    text = extract_text_from_pdf(pdf_path)
+    try:
+        text = await extract_text_from_pdf(pdf_path)
+    except PDFExtractionError as e:
+        return str(e)
     if len(text) > 8000:
         text = text[:8000] + "\n\n[Text truncated...]"
-    return explain_research_paper(text)
+    return await explain_research_paper(text, provider=get_llm())
 
 
-def post_from_pdf(pdf_path):
+async def post_from_pdf(pdf_path):
     """Create social media post from the uploaded PDF."""
     if not pdf_path:
         return "Please upload a PDF file first."
-    analysis = analyze_uploaded_pdf(pdf_path)
-    return write_social_media_post(analysis)
+    try:
+        text = await extract_text_from_pdf(pdf_path)
+    except PDFExtractionError as e:
+        return str(e)
+    analysis = await analyze_uploaded_pdf(pdf_path, text=text)
+    return await write_social_media_post(analysis, provider=get_llm())
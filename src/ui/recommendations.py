@@ -2,12 +2,14 @@
 UI handlers for paper recommendation functionality.
 """
 
-from src.tools.paper_recommender import recommend_similar_papers, quick_recommend
-from src.tools import extract_text_from_pdf
+import asyncio
+from src.core.llm_provider import get_llm
+from src.tools.paper_recommender import recommend_similar_papers, quick_recommend, ensure_ready
+from src.tools import extract_text_from_pdf, PDFExtractionError
 from src.logging import logger
 
 
-def recommend_from_text(paper_info: str, num_papers: int = 10) -> str:
+async def recommend_from_text(paper_info: str, num_papers: int = 10) -> str:
     """
     Get similar paper recommendations from text input.
 
@@ -27,7 +29,7 @@ def recommend_from_text(paper_info: str, num_papers: int = 10) -> str:
     logger.info(f"🔍 UI REQUEST: Get recommendations ({len(paper_info)} chars, limit={num_papers})")
 
     try:
-        result = recommend_similar_papers(paper_info, num_recommendations=num_papers)
+        result = await recommend_similar_papers(paper_info, provider=get_llm(), num_recommendations=num_papers)
         return result
 
     except Exception as e:
@@ -35,7 +37,7 @@ def recommend_from_text(paper_info: str, num_papers: int = 10) -> str:
         return f"❌ Error getting recommendations: {str(e)}"
 
 
-def recommend_from_pdf(pdf_path: str, num_papers: int = 10) -> str:
+async def recommend_from_pdf(pdf_path: str, num_papers: int = 10) -> str:
     """
     Get similar paper recommendations from uploaded PDF.
 
@@ -55,15 +57,22 @@ def recommend_from_pdf(pdf_path: str, num_papers: int = 10) -> str:
     logger.info(f"🔍 UI REQUEST: Get recommendations from PDF: {pdf_path}")
 
     try:
+        # Warm up the Semantic Scholar connection while the PDF is parsed
+        warmup = asyncio.create_task(ensure_ready())
+
         # Extract text from PDF
         logger.info("📄 Extracting text from PDF...")
-        paper_text = extract_text_from_pdf(pdf_path)
-
-        if paper_text.startswith("Error"):
-            return paper_text
+        try:
+            paper_text = await extract_text_from_pdf(pdf_path)
+        except PDFExtractionError as e:
+            return f"❌ Error processing PDF: {str(e)}"
+        finally:
+            # The warm-up only saves a handshake, so never hold the response up for it;
+            # executor calls already running still finish and leave their connection pooled
+            warmup.cancel()
 
         # Get recommendations based on extracted text
-        result = recommend_similar_papers(paper_text, num_recommendations=num_papers)
+        result = await recommend_similar_papers(paper_text, provider=get_llm(), num_recommendations=num_papers)
         return result
 
     except Exception as e:
@@ -71,7 +80,7 @@ def recommend_from_pdf(pdf_path: str, num_papers: int = 10) -> str:
         return f"❌ Error processing PDF: {str(e)}"
 
 
-def quick_recommend_by_id(paper_id: str, num_papers: int = 5) -> str:
+async def quick_recommend_by_id(paper_id: str, num_papers: int = 5) -> str:
     """
     Quick recommendations by DOI or arXiv ID.
 
@@ -91,7 +100,7 @@ def quick_recommend_by_id(paper_id: str, num_papers: int = 5) -> str:
     logger.info(f"🔍 UI REQUEST: Quick recommend for ID: {paper_id}")
 
     try:
-        result = quick_recommend(paper_id, num_papers=num_papers)
+        result = await quick_recommend(paper_id, get_llm(), num_papers=num_papers)
         return result
 
     except Exception as e:
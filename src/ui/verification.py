@@ -2,12 +2,19 @@
 UI handlers for source verification functionality.
 """
 
-from src.tools.source_verifier import verify_document_sources, quick_verify_references, quick_verify_claims
-from src.tools import extract_text_from_pdf
+import asyncio
+from src.core.llm_provider import get_llm
+from src.tools.source_verifier import verify_document_sources, quick_verify_references, quick_verify_claims, ensure_ready
+from src.tools import extract_text_from_pdf, PDFExtractionError
 from src.logging import logger
 
 
-def verify_text_input(text_input: str, verify_refs: bool, verify_claims_flag: bool) -> str:
+def _is_blank(text: str) -> bool:
+    """Return True for empty or whitespace-only text without copying it (unlike strip())."""
+    return not text or text.isspace()
+
+
+async def verify_text_input(text_input: str, verify_refs: bool, verify_claims_flag: bool) -> str:
     """
     Verify sources in text input.
 
@@ -19,7 +26,7 @@ def verify_text_input(text_input: str, verify_refs: bool, verify_claims_flag: bo
     Returns:
         Verification report
     """
-    if not text_input or text_input.strip() == "":
+    if _is_blank(text_input):
         return "⚠️ Please provide document text to verify."
 
     if not verify_refs and not verify_claims_flag:
@@ -28,7 +35,7 @@ def verify_text_input(text_input: str, verify_refs: bool, verify_claims_flag: bo
     logger.info(f"🔍 UI REQUEST: Verify text ({len(text_input)} chars, refs={verify_refs}, claims={verify_claims_flag})")
 
     try:
-        result = verify_document_sources(text_input, verify_claims=verify_claims_flag, verify_references=verify_refs)
+        result = await verify_document_sources(text_input, provider=get_llm(), verify_claims=verify_claims_flag, verify_references=verify_refs)
         return result
 
     except Exception as e:
@@ -36,7 +43,7 @@ def verify_text_input(text_input: str, verify_refs: bool, verify_claims_flag: bo
         return f"❌ Error during verification: {str(e)}"
 
 
-def verify_pdf_input(pdf_path: str, verify_refs: bool, verify_claims_flag: bool) -> str:
+async def verify_pdf_input(pdf_path: str, verify_refs: bool, verify_claims_flag: bool) -> str:
     """
     Verify sources in uploaded PDF.
 
@@ -57,15 +64,22 @@ def verify_pdf_input(pdf_path: str, verify_refs: bool, verify_claims_flag: bool)
     logger.info(f"🔍 UI REQUEST: Verify PDF: {pdf_path}")
 
     try:
+        # Warm up the API connections while the PDF is parsed
+        warmup = asyncio.create_task(ensure_ready())
+
         # Extract text from PDF
         logger.info("📄 Extracting text from PDF...")
-        paper_text = extract_text_from_pdf(pdf_path)
-
-        if paper_text.startswith("Error"):
-            return paper_text
+        try:
+            paper_text = await extract_text_from_pdf(pdf_path)
+        except PDFExtractionError as e:
+            return f"❌ Error processing PDF: {str(e)}"
+        finally:
+            # The warm-up only saves a handshake, so never hold the response up for it;
+            # executor calls already running still finish and leave their connection pooled
+            warmup.cancel()
 
         # Verify the extracted text
-        result = verify_document_sources(paper_text, verify_claims=verify_claims_flag, verify_references=verify_refs)
+        result = await verify_document_sources(paper_text, provider=get_llm(), verify_claims=verify_claims_flag, verify_references=verify_refs)
         return result
 
     except Exception as e:
@@ -73,30 +87,30 @@ def verify_pdf_input(pdf_path: str, verify_refs: bool, verify_claims_flag: bool)
         return f"❌ Error processing PDF: {str(e)}"
 
 
-def quick_verify_text_references(text_input: str) -> str:
+async def quick_verify_text_references(text_input: str) -> str:
     """Quick reference-only verification from text."""
-    if not text_input or text_input.strip() == "":
+    if _is_blank(text_input):
         return "⚠️ Please provide document text to verify."
 
     logger.info(f"🔍 UI REQUEST: Quick reference verification ({len(text_input)} chars)")
 
     try:
-        result = quick_verify_references(text_input)
+        result = await quick_verify_references(text_input, get_llm())
         return result
     except Exception as e:
         logger.error(f"❌ ERROR in quick_verify_text_references: {str(e)}")
         return f"❌ Error: {str(e)}"
 
 
-def quick_verify_text_claims(text_input: str) -> str:
+async def quick_verify_text_claims(text_input: str) -> str:
     """Quick claim-only verification from text."""
-    if not text_input or text_input.strip() == "":
+    if _is_blank(text_input):
         return "⚠️ Please provide document text to verify."
 
     logger.info(f"🔍 UI REQUEST: Quick claim verification ({len(text_input)} chars)")
 
     try:
-        result = quick_verify_claims(text_input)
+        result = await quick_verify_claims(text_input, get_llm())
         return result
     except Exception as e:
         logger.error(f"❌ ERROR in quick_verify_text_claims: {str(e)}")
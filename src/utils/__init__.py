@@ -1,13 +1,41 @@
 """Utils module for the Agentic Research Assistant."""
 
-from .tool_registry import tools, get_function_map, get_async_function_map, get_tool_schemas
-from .api_clients import SemanticScholarAPI, CrossRefAPI, RateLimiter
+import importlib
+
+# Attributes loaded from their submodule on first access (PEP 562), so that
+# importing src.utils does not pull in requests, genai, etc. until needed.
+# The tool registry is lazy too: the tools import src.utils submodules, and
+# loading the registry from here would let it import a tool that is still
+# half-initialized.
+_LAZY_ATTRS = {
+    "tools": ".tool_registry",
+    "function_map": ".tool_registry",
+    "get_function_map": ".tool_registry",
+    "get_async_function_map": ".tool_registry",
+    "get_tool_schemas": ".tool_registry",
+    "get_tool_schemas_json": ".tool_registry",
+    "get_schemas_for": ".tool_registry",
+    "SemanticScholarAPI": ".api_clients",
+    "CrossRefAPI": ".api_clients",
+    "RateLimiter": ".api_clients",
+    "AsyncRateLimiter": ".api_clients",
+    "get_host_limiter": ".api_clients",
+    "get_semantic_scholar": ".api_clients",
+    "get_crossref": ".api_clients",
+    "get_api_cache": ".api_cache",
+    "upload_file_cached": ".file_upload_cache",
+    "run_in_pdf_pool": ".pdf_pool",
+}
+
 
-# For backward compatibility - lazy load function_map
 def __getattr__(name):
-    if name == "function_map":
-        return get_function_map()
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "tools",
@@ -15,7 +43,16 @@ __all__ = [
     "function_map",
     "get_async_function_map",
     "get_tool_schemas",
+    "get_tool_schemas_json",
+    "get_schemas_for",
     "SemanticScholarAPI",
     "CrossRefAPI",
     "RateLimiter",
+    "AsyncRateLimiter",
+    "get_host_limiter",
+    "get_semantic_scholar",
+    "get_crossref",
+    "get_api_cache",
+    "upload_file_cached",
+    "run_in_pdf_pool",
 ]
@@ -0,0 +1,220 @@
+"""
+Two-tier cache for DOI metadata lookups.
+An in-memory dict serves repeat lookups within a session, and an SQLite store
+keeps results across runs so recurring DOIs skip the network entirely.
+Expired entries keep their ETag/Last-Modified so they can be revalidated with
+a conditional request instead of downloaded again.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+from src.config import API_CACHE_ENABLED, API_CACHE_MEMORY_SIZE, API_CACHE_PATH, API_CACHE_TTL
+from src.logging import logger
+
+
+class CacheEntry(NamedTuple):
+    """A cached response body with the validators needed to revalidate it."""
+    value: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, value: Any, response: Any) -> "CacheEntry":
+        """Build an entry for a decoded body, keeping the response's validators."""
+        return cls(value, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that make the server answer 304 if this entry is still current."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ApiCache:
+    """Memory (LRU) + SQLite cache with per-entry expiry."""
+
+    def __init__(
+        self,
+        path: str = API_CACHE_PATH,
+        ttl: float = API_CACHE_TTL,
+        enabled: bool = API_CACHE_ENABLED,
+        memory_size: int = API_CACHE_MEMORY_SIZE,
+    ):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.enabled = enabled
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[float, CacheEntry]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # Per-key locks (with their number of holders and waiters) so concurrent
+        # lookups of the same DOI make one request; dropped once nobody needs them
+        self._inflight: Dict[str, Tuple[threading.Lock, int]] = {}
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store on first use; fall back to memory only if that fails."""
+        if self._db is None:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._db = sqlite3.connect(self.path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS api_cache (key TEXT PRIMARY KEY, value TEXT, expires REAL,"
+                    " etag TEXT, last_modified TEXT)"
+                )
+                # Stores created before validators were kept lack their columns
+                columns = {row[1] for row in self._db.execute("PRAGMA table_info(api_cache)")}
+                for column in ("etag", "last_modified"):
+                    if column not in columns:
+                        self._db.execute(f"ALTER TABLE api_cache ADD COLUMN {column} TEXT")
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"⚠️ API cache disk store unavailable, using memory only: {str(e)}")
+                self.path = ""
+        return self._db if self.path else None
+
+    def get_entry(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Look up key, including expired entries.
+
+        Returns:
+            Tuple of (entry or None, whether the entry is still fresh)
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                return cached[1], cached[0] > now
+
+            db = self._connect()
+            if db is None:
+                return None, False
+            try:
+                row = db.execute(
+                    "SELECT value, expires, etag, last_modified FROM api_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"API cache read failed for {key}: {str(e)}")
+                return None, False
+            if row is None:
+                return None, False
+            entry = CacheEntry(json.loads(row[0]), row[2], row[3])
+            self._remember(key, row[1], entry)
+            return entry, row[1] > now
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry, fresh = self.get_entry(key)
+        return entry.value if fresh else None
+
+    def set(self, key: str, value: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a JSON-serializable value (and its validators) under key for the cache TTL."""
+        expires = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, expires, CacheEntry(value, etag, last_modified))
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO api_cache (key, value, expires, etag, last_modified)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, json.dumps(value), expires, etag, last_modified),
+                )
+                db.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.debug(f"API cache write failed for {key}: {str(e)}")
+
+    def _remember(self, key: str, expires: float, entry: CacheEntry) -> None:
+        """Keep an entry in memory, dropping the least recently used beyond memory_size (lock held)."""
+        self._memory[key] = (expires, entry)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def evict(self, doi: str) -> None:
+        """Drop every cached entry for a DOI, from all APIs."""
+        with self._lock:
+            for key in [k for k in self._memory if k.split(":", 1)[1] == doi]:
+                del self._memory[key]
+            db = self._connect()
+            if db is not None:
+                try:
+                    db.execute("DELETE FROM api_cache WHERE substr(key, instr(key, ':') + 1) = ?", (doi,))
+                    db.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"API cache eviction failed for {doi}: {str(e)}")
+
+    @contextmanager
+    def key_lock(self, key: str) -> Iterator[None]:
+        """Hold the lock that serializes fetches of a single key."""
+        with self._lock:
+            lock, users = self._inflight.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._inflight[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._inflight[key]
+                if users == 1:
+                    del self._inflight[key]
+                else:
+                    self._inflight[key] = (lock, users - 1)
+
+
+_api_cache: Optional[ApiCache] = None
+
+
+def get_api_cache() -> ApiCache:
+    """Get the shared API cache, creating it on first use."""
+    global _api_cache
+    if _api_cache is None:
+        _api_cache = ApiCache()
+    return _api_cache
+
+
+def cached_fetch(key: str, fetch: Callable[[Optional[CacheEntry]], Optional[CacheEntry]]) -> Optional[Any]:
+    """
+    Return the value cached under key, calling fetch() when it is missing or expired.
+
+    fetch receives the expired entry (or None) so it can send a conditional
+    request, and returns that same entry when the server answers 304. Only
+    found values are cached, since None also covers transient errors.
+    Concurrent callers asking for the same key wait for a single fetch.
+
+    Args:
+        key: Cache key, e.g. f"s2:{doi}"
+        fetch: Performs the request and returns the new entry or None
+    """
+    cache = get_api_cache()
+    if not cache.enabled:
+        entry = fetch(None)
+        return entry.value if entry else None
+
+    cached = cache.get(key)
+    if cached is not None:
+        logger.debug(f"📦 API cache hit: {key}")
+        return cached
+
+    with cache.key_lock(key):
+        # Another caller may have fetched it while we waited
+        stale, fresh = cache.get_entry(key)
+        if fresh:
+            return stale.value
+        entry = fetch(stale)
+        if entry is None:
+            return None
+        cache.set(key, entry.value, entry.etag, entry.last_modified)
+        return entry.value
@@ -3,10 +3,127 @@ API clients for external research databases and services.
 Supports Semantic Scholar, CrossRef, and Google Search for verification.
 """
 
+import asyncio
+import copy
+import functools
+import inspect
 import requests
 import time
-from typing import Dict, List, Optional, Any
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util import Retry
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from src.logging import logger
+from src.utils.api_cache import CacheEntry, cached_fetch, get_api_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# urllib3 only decodes brotli responses when one of these is installed
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Most IDs Semantic Scholar accepts in one /paper/batch request
+S2_BATCH_SIZE = 500
+
+# Most results Semantic Scholar returns per /paper/search request
+S2_SEARCH_PAGE_SIZE = 100
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, with orjson when it is installed.
+
+    Raises:
+        requests.exceptions.InvalidJSONError: If the body is not valid JSON
+    """
+    try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content)
+        return json.loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response)
+
+
+def safe_request(default: Any, message: str) -> Callable:
+    """
+    Turn a request error in the decorated API method into a logged default result.
+
+    Args:
+        default: Value returned when a requests.exceptions.RequestException is raised
+        message: Log message, formatted with the method's arguments (e.g. "Error retrieving DOI {doi}")
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except requests.exceptions.RequestException as e:
+                bound = signature.bind(*args, **kwargs)
+                logger.error(f"❌ {message.format(**bound.arguments)}: {str(e)}")
+                return copy.copy(default)
+        return wrapper
+    return decorator
+
+
+def _pooled_session(pool_size: int = 32) -> requests.Session:
+    """
+    Create a keep-alive session sized for concurrent callers.
+
+    Connection errors and RETRY_STATUSES responses are retried with exponential
+    backoff, honoring any Retry-After header the API sends. Once retries are
+    exhausted the last response is returned for the caller to raise_for_status().
+    """
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=sorted(RETRY_STATUSES),
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    if BROTLI_AVAILABLE:
+        session.headers['Accept-Encoding'] = 'br, gzip, deflate'
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _warm_up_connection(session: requests.Session, url: str, timeout: float = 5.0) -> None:
+    """
+    Open a keep-alive connection in the session's pool with a single HEAD.
+
+    Goes through the adapter's urllib3 pool directly so the request is made
+    exactly once: the session's retry policy is for real lookups, and a
+    warm-up against an unreachable host must fail fast.
+
+    Raises:
+        urllib3.exceptions.HTTPError: If the host cannot be reached
+    """
+    pool = session.get_adapter(url).poolmanager.connection_from_url(url)
+    pool.urlopen(
+        "HEAD", urlsplit(url).path or "/", headers=dict(session.headers), retries=False, timeout=timeout
+    )
 
 
 class SemanticScholarAPI:
@@ -15,45 +132,77 @@ class SemanticScholarAPI:
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _pooled_session()
         self.session.headers.update({
             'User-Agent': 'AcademicResearchAssistant/1.0'
         })
 
-    def search_paper(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+    def warm_up(self) -> None:
+        """Open a pooled connection to the API host so the first real request skips the TLS handshake."""
+        try:
+            _warm_up_connection(self.session, self.BASE_URL)
+        except Urllib3HTTPError as e:
+            logger.debug(f"Semantic Scholar warm-up failed: {str(e)}")
+
+    def iter_search(self, query: str, limit: int = 100, page_size: int = S2_SEARCH_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
         """
-        Search for papers by query string.
+        Search for papers by query string, fetching result pages lazily.
+
+        Pages are only requested as the caller consumes results, so stopping
+        early saves the remaining requests.
 
         Args:
             query: Search query
             limit: Maximum number of results
+            page_size: Results requested per call (at most S2_SEARCH_PAGE_SIZE)
 
-        Returns:
-            List of paper metadata dictionaries
+        Yields:
+            Paper metadata dictionaries
         """
-        try:
-            logger.debug(f"🔍 Semantic Scholar search: '{query}'")
+        url = f"{self.BASE_URL}/paper/search"
+        page_size = max(1, min(page_size, limit, S2_SEARCH_PAGE_SIZE))
+        offset = 0
 
-            url = f"{self.BASE_URL}/paper/search"
+        while offset < limit:
             params = {
                 'query': query,
-                'limit': limit,
+                'offset': offset,
+                'limit': min(page_size, limit - offset),
                 'fields': 'title,authors,year,abstract,citationCount,url,externalIds'
             }
+            try:
+                logger.debug(f"🔍 Semantic Scholar search: '{query}' (offset {offset})")
+                response = self.session.get(url, params=params, timeout=10)
+                response.raise_for_status()
+                data = _decode_json(response)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"❌ Semantic Scholar API error: {str(e)}")
+                return
 
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
             papers = data.get('data', [])
+            yield from papers
 
-            logger.info(f"📚 Found {len(papers)} papers from Semantic Scholar")
-            return papers
+            offset += len(papers)
+            # A short page (or no 'next' offset) means the results are exhausted
+            if len(papers) < params['limit'] or 'next' not in data:
+                return
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Semantic Scholar API error: {str(e)}")
-            return []
+    def search_paper(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Search for papers by query string.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+
+        Returns:
+            List of paper metadata dictionaries
+        """
+        papers = list(self.iter_search(query, limit=limit))
+        logger.info(f"📚 Found {len(papers)} papers from Semantic Scholar")
+        return papers
 
+    @safe_request(None, "Error retrieving DOI {doi}")
     def get_paper_by_doi(self, doi: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve paper metadata by DOI.
@@ -62,32 +211,111 @@ class SemanticScholarAPI:
             doi: Digital Object Identifier
 
         Returns:
-            Paper metadata or None if not found
+            Paper metadata or None if not found (or the lookup failed)
         """
-        try:
-            logger.debug(f"🔍 Looking up DOI: {doi}")
+        return self._lookup_paper_by_doi(doi)
 
-            url = f"{self.BASE_URL}/paper/DOI:{doi}"
-            params = {
-                'fields': 'title,authors,year,abstract,citationCount,url,externalIds'
-            }
+    def _lookup_paper_by_doi(self, doi: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve paper metadata by DOI through the API cache.
+
+        Returns:
+            Paper metadata or None if Semantic Scholar does not know the DOI
+
+        Raises:
+            requests.exceptions.RequestException: If the lookup failed
+        """
+        return cached_fetch(f"s2:{doi}", lambda cached: self._fetch_paper_by_doi(doi, cached))
 
-            response = self.session.get(url, params=params, timeout=10)
+    def _fetch_paper_by_doi(self, doi: str, cached: Optional[CacheEntry]) -> Optional[CacheEntry]:
+        """Request a DOI's metadata, revalidating an expired cache entry if there is one."""
+        logger.debug(f"🔍 Looking up DOI: {doi}")
 
-            if response.status_code == 404:
-                logger.warning(f"⚠️ DOI not found: {doi}")
-                return None
+        url = f"{self.BASE_URL}/paper/DOI:{doi}"
+        params = {
+            'fields': 'title,authors,year,abstract,citationCount,url,externalIds'
+        }
+        headers = cached.conditional_headers() if cached else None
 
-            response.raise_for_status()
-            paper = response.json()
+        response = self.session.get(url, params=params, headers=headers, timeout=10)
 
-            logger.info(f"✅ Retrieved paper: {paper.get('title', 'Unknown')}")
-            return paper
+        if response.status_code == 304 and cached:
+            logger.debug(f"📦 Cached DOI still current: {doi}")
+            return cached
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Error retrieving DOI {doi}: {str(e)}")
+        if response.status_code == 404:
+            logger.warning(f"⚠️ DOI not found: {doi}")
             return None
 
+        response.raise_for_status()
+        paper = _decode_json(response)
+
+        logger.info(f"✅ Retrieved paper: {paper.get('title', 'Unknown')}")
+        return CacheEntry.from_response(paper, response)
+
+    def get_papers_by_dois(self, dois: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieve metadata for many DOIs with Semantic Scholar's batch endpoint.
+
+        Cached DOIs are served from the API cache; the rest are posted in
+        chunks of up to S2_BATCH_SIZE. If a chunk is rejected (e.g. because of
+        a malformed DOI), its DOIs are looked up one by one instead.
+
+        Args:
+            dois: Digital Object Identifiers
+
+        Returns:
+            Mapping of DOI to paper metadata, or to None for DOIs Semantic
+            Scholar does not know. DOIs whose lookup failed are left out.
+        """
+        cache = get_api_cache()
+        papers: Dict[str, Optional[Dict[str, Any]]] = {}
+        unique_dois = list(dict.fromkeys(dois))
+        missing = []
+        for doi in unique_dois:
+            cached = cache.get(f"s2:{doi}") if cache.enabled else None
+            if cached is not None:
+                papers[doi] = cached
+            else:
+                missing.append(doi)
+
+        url = f"{self.BASE_URL}/paper/batch"
+        params = {
+            'fields': 'title,authors,year,abstract,citationCount,url,externalIds'
+        }
+
+        for start in range(0, len(missing), S2_BATCH_SIZE):
+            chunk = missing[start:start + S2_BATCH_SIZE]
+            try:
+                logger.debug(f"🔍 Semantic Scholar batch lookup of {len(chunk)} DOIs")
+                response = self.session.post(
+                    url, params=params, json={'ids': [f"DOI:{doi}" for doi in chunk]}, timeout=30
+                )
+                if 400 <= response.status_code < 500 and response.status_code != 429:
+                    logger.warning(f"⚠️ Batch lookup rejected ({response.status_code}), looking up DOIs individually")
+                    for doi in chunk:
+                        # Only record DOIs Semantic Scholar answered for; failed
+                        # lookups stay out of papers so callers retry them
+                        try:
+                            papers[doi] = self._lookup_paper_by_doi(doi)
+                        except requests.exceptions.RequestException as e:
+                            logger.error(f"❌ Error retrieving DOI {doi}: {str(e)}")
+                    continue
+
+                response.raise_for_status()
+                # Results come back in request order, with null for unknown IDs
+                for doi, paper in zip(chunk, _decode_json(response)):
+                    papers[doi] = paper
+                    if paper and cache.enabled:
+                        cache.set(f"s2:{doi}", paper)
+
+            except requests.exceptions.RequestException as e:
+                logger.error(f"❌ Semantic Scholar batch lookup error: {str(e)}")
+
+        logger.info(f"✅ Retrieved {sum(1 for p in papers.values() if p)}/{len(unique_dois)} papers by DOI")
+        return papers
+
+    @safe_request([], "Error getting recommendations for {paper_id}")
     def get_recommendations(self, paper_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get paper recommendations from Semantic Scholar.
@@ -99,32 +327,27 @@ class SemanticScholarAPI:
         Returns:
             List of recommended paper dictionaries
         """
-        try:
-            logger.debug(f"🔍 Getting recommendations for paper: {paper_id}")
+        logger.debug(f"🔍 Getting recommendations for paper: {paper_id}")
 
-            url = f"{self.BASE_URL}/paper/{paper_id}/recommendations"
-            params = {
-                'fields': 'title,authors,year,abstract,citationCount,url,externalIds,venue,paperId',
-                'limit': limit
-            }
-
-            response = self.session.get(url, params=params, timeout=15)
+        url = f"{self.BASE_URL}/paper/{paper_id}/recommendations"
+        params = {
+            'fields': 'title,authors,year,abstract,citationCount,url,externalIds,venue,paperId',
+            'limit': limit
+        }
 
-            if response.status_code == 404:
-                logger.warning(f"⚠️ Paper not found or no recommendations available: {paper_id}")
-                return []
+        response = self.session.get(url, params=params, timeout=15)
 
-            response.raise_for_status()
+        if response.status_code == 404:
+            logger.warning(f"⚠️ Paper not found or no recommendations available: {paper_id}")
+            return []
 
-            data = response.json()
-            recommendations = data.get('recommendedPapers', [])
+        response.raise_for_status()
 
-            logger.info(f"✅ Found {len(recommendations)} recommendations")
-            return recommendations
+        data = _decode_json(response)
+        recommendations = data.get('recommendedPapers', [])
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Error getting recommendations for {paper_id}: {str(e)}")
-            return []
+        logger.info(f"✅ Found {len(recommendations)} recommendations")
+        return recommendations
 
 
 class CrossRefAPI:
@@ -133,11 +356,31 @@ class CrossRefAPI:
     BASE_URL = "https://api.crossref.org/works"
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = _pooled_session()
         self.session.headers.update({
             'User-Agent': 'AcademicResearchAssistant/1.0 (mailto:research@example.com)'
         })
+        # Calls per second advertised by CrossRef's X-Rate-Limit-* headers (None until seen)
+        self.rate_limit: Optional[float] = None
+
+    def warm_up(self) -> None:
+        """Open a pooled connection to the API host so the first real request skips the TLS handshake."""
+        try:
+            _warm_up_connection(self.session, self.BASE_URL)
+        except Urllib3HTTPError as e:
+            logger.debug(f"CrossRef warm-up failed: {str(e)}")
+
+    def _update_rate_limit(self, response: requests.Response):
+        """Record the rate limit CrossRef advertises, e.g. 50 requests per '1s'."""
+        limit = response.headers.get('X-Rate-Limit-Limit')
+        interval = response.headers.get('X-Rate-Limit-Interval', '1s')
+        try:
+            seconds = float(interval.rstrip('s')) or 1.0
+            self.rate_limit = float(limit) / seconds
+        except (TypeError, ValueError):
+            pass
 
+    @safe_request(None, "CrossRef API error")
     def search_by_title(self, title: str, author: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Search for a paper by title and optionally author.
@@ -149,34 +392,30 @@ class CrossRefAPI:
         Returns:
             Best matching paper metadata or None
         """
-        try:
-            logger.debug(f"🔍 CrossRef search: '{title[:50]}...'")
-
-            params = {
-                'query.title': title,
-                'rows': 5
-            }
-
-            if author:
-                params['query.author'] = author
-
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-            items = data.get('message', {}).get('items', [])
-
-            if items:
-                # Return the best match (first result)
-                best_match = items[0]
-                logger.info(f"✅ Found CrossRef match: {best_match.get('title', ['Unknown'])[0]}")
-                return best_match
-            else:
-                logger.warning("⚠️ No CrossRef matches found")
-                return None
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ CrossRef API error: {str(e)}")
+        logger.debug(f"🔍 CrossRef search: '{title[:50]}...'")
+
+        params = {
+            'query.title': title,
+            'rows': 5
+        }
+
+        if author:
+            params['query.author'] = author
+
+        response = self.session.get(self.BASE_URL, params=params, timeout=10)
+        self._update_rate_limit(response)
+        response.raise_for_status()
+
+        data = _decode_json(response)
+        items = data.get('message', {}).get('items', [])
+
+        if items:
+            # Return the best match (first result)
+            best_match = items[0]
+            logger.info(f"✅ Found CrossRef match: {best_match.get('title', ['Unknown'])[0]}")
+            return best_match
+        else:
+            logger.warning("⚠️ No CrossRef matches found")
             return None
 
     def get_by_doi(self, doi: str) -> Optional[Dict[str, Any]]:
@@ -189,27 +428,33 @@ class CrossRefAPI:
         Returns:
             Paper metadata or None if not found
         """
-        try:
-            logger.debug(f"🔍 CrossRef DOI lookup: {doi}")
+        return cached_fetch(f"crossref:{doi}", lambda cached: self._fetch_by_doi(doi, cached))
 
-            url = f"{self.BASE_URL}/{doi}"
-            response = self.session.get(url, timeout=10)
+    @safe_request(None, "Error retrieving DOI {doi}")
+    def _fetch_by_doi(self, doi: str, cached: Optional[CacheEntry]) -> Optional[CacheEntry]:
+        """Request a DOI's work record, revalidating an expired cache entry if there is one."""
+        logger.debug(f"🔍 CrossRef DOI lookup: {doi}")
 
-            if response.status_code == 404:
-                logger.warning(f"⚠️ DOI not found in CrossRef: {doi}")
-                return None
+        url = f"{self.BASE_URL}/{doi}"
+        headers = cached.conditional_headers() if cached else None
+        response = self.session.get(url, headers=headers, timeout=10)
+        self._update_rate_limit(response)
 
-            response.raise_for_status()
+        if response.status_code == 304 and cached:
+            logger.debug(f"📦 Cached CrossRef record still current: {doi}")
+            return cached
 
-            data = response.json()
-            work = data.get('message', {})
+        if response.status_code == 404:
+            logger.warning(f"⚠️ DOI not found in CrossRef: {doi}")
+            return None
 
-            logger.info(f"✅ Retrieved from CrossRef: {work.get('title', ['Unknown'])[0]}")
-            return work
+        response.raise_for_status()
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Error retrieving DOI {doi}: {str(e)}")
-            return None
+        data = _decode_json(response)
+        work = data.get('message', {})
+
+        logger.info(f"✅ Retrieved from CrossRef: {work.get('title', ['Unknown'])[0]}")
+        return CacheEntry.from_response(work, response)
 
 
 class GoogleSearchAPI:
@@ -254,17 +499,112 @@ class GoogleSearchAPI:
             return []
 
 
+# Shared clients so connections (and learned rate limits) outlive a single request
+_semantic_scholar: Optional[SemanticScholarAPI] = None
+_crossref: Optional[CrossRefAPI] = None
+
+
+def get_semantic_scholar() -> SemanticScholarAPI:
+    """Get the shared Semantic Scholar client, creating it on first use."""
+    global _semantic_scholar
+    if _semantic_scholar is None:
+        _semantic_scholar = SemanticScholarAPI()
+    return _semantic_scholar
+
+
+def get_crossref() -> CrossRefAPI:
+    """Get the shared CrossRef client, creating it on first use."""
+    global _crossref
+    if _crossref is None:
+        _crossref = CrossRefAPI()
+    return _crossref
+
+
 # Rate limiting helper
-class RateLimiter:
-    """Simple rate limiter for API calls."""
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for API calls.
 
-    def __init__(self, calls_per_second: float = 2.0):
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0.0
+    Up to `burst` calls go through immediately, then calls are spaced to
+    `calls_per_second`. Waiting uses asyncio.sleep, so throttled callers do
+    not block other coroutines:
+
+        async with limiter:
+            ...
+    """
+
+    def __init__(self, calls_per_second: float = 2.0, burst: int = 1):
+        self.rate = calls_per_second
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+
+    def set_rate(self, calls_per_second: float):
+        """Change the allowed call rate (e.g. from server rate-limit headers)."""
+        self.rate = calls_per_second
+
+    def wait_time(self) -> float:
+        """
+        Take a token and return how long to wait before using it.
+
+        The token is reserved immediately (the bucket may go negative), so
+        concurrent callers each get a distinct slot.
+
+        Returns:
+            Seconds to wait before making the call
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self):
+        """Wait until a call is allowed."""
+        delay = self.wait_time()
+        if delay:
+            await asyncio.sleep(delay)
 
     def wait(self):
-        """Wait if necessary to respect rate limit."""
-        elapsed = time.time() - self.last_call
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call = time.time()
+        """Blocking variant of acquire() for synchronous callers."""
+        delay = self.wait_time()
+        if delay:
+            time.sleep(delay)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+# Kept for existing imports
+RateLimiter = AsyncRateLimiter
+
+# Calls per second and burst allowed per API host; unknown hosts get the default
+HOST_RATE_LIMITS = {
+    "api.semanticscholar.org": (1.5, 3),
+    "api.crossref.org": (2.0, 5),
+}
+DEFAULT_RATE_LIMIT = (2.0, 1)
+
+_host_limiters: Dict[str, AsyncRateLimiter] = {}
+
+
+def get_host_limiter(url: str) -> AsyncRateLimiter:
+    """
+    Get the rate limiter shared by all calls to a URL's host.
+
+    Separate hosts get separate limiters, so CrossRef and Semantic Scholar
+    calls do not throttle each other.
+
+    Args:
+        url: Any URL on the API host (e.g. a client's BASE_URL)
+    """
+    host = urlsplit(url).netloc
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        calls_per_second, burst = HOST_RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+        limiter = _host_limiters[host] = AsyncRateLimiter(calls_per_second, burst)
+    return limiter
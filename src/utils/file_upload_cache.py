@@ -0,0 +1,100 @@
+"""
+Content-addressed cache for files uploaded to Gemini.
+Re-attaching the same file reuses the existing upload instead of sending it again.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Tuple
+import google.generativeai as genai
+from src.logging import logger
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+
+# Gemini deletes uploaded files after 48 hours
+FILE_TTL_SECONDS = 48 * 60 * 60
+_CHUNK_SIZE = 1024 * 1024
+
+# The SDK has no async upload, so run uploads on a small dedicated pool
+# instead of the default executor shared with everything else
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gemini-upload")
+
+_CACHE: Dict[str, Tuple[float, Any]] = {}
+_LOCKS: Dict[str, asyncio.Lock] = {}
+
+
+def _file_digest(path: str) -> str:
+    """Hash a file's contents in 1 MiB chunks."""
+    hasher = blake3.blake3() if BLAKE3_AVAILABLE else hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _evict_expired() -> None:
+    """Drop entries whose uploads Gemini has already deleted."""
+    cutoff = time.time() - FILE_TTL_SECONDS
+    for digest in [d for d, (uploaded_at, _) in _CACHE.items() if uploaded_at < cutoff]:
+        del _CACHE[digest]
+        _LOCKS.pop(digest, None)
+
+
+def _is_usable(uploaded_file: Any) -> bool:
+    """Check with Gemini that a previously uploaded file still exists and did not fail."""
+    try:
+        current = genai.get_file(uploaded_file.name)
+    except Exception as e:
+        logger.debug(f"📎 Cached upload {uploaded_file.name} no longer available: {e}")
+        return False
+    return current.state.name in ("ACTIVE", "PROCESSING")
+
+
+async def upload_file_cached(path: str) -> Any:
+    """
+    Upload a file to Gemini, reusing a previous upload of identical content.
+
+    Args:
+        path: Path to the local file
+
+    Returns:
+        The uploaded Gemini file reference
+    """
+    loop = asyncio.get_running_loop()
+    digest = await loop.run_in_executor(_UPLOAD_EXECUTOR, _file_digest, path)
+    _evict_expired()
+
+    lock = _LOCKS.setdefault(digest, asyncio.Lock())
+    async with lock:
+        cached = _CACHE.get(digest)
+        if cached is not None:
+            uploaded_file = cached[1]
+            if await loop.run_in_executor(_UPLOAD_EXECUTOR, _is_usable, uploaded_file):
+                logger.debug(f"📎 Reusing uploaded file {uploaded_file.name} for {path}")
+                return uploaded_file
+            del _CACHE[digest]
+
+        # A running upload cannot be interrupted, but one still waiting for a
+        # worker is skipped if the caller has been cancelled in the meantime
+        cancelled = threading.Event()
+
+        def _upload():
+            if cancelled.is_set():
+                raise asyncio.CancelledError()
+            return genai.upload_file(path)
+
+        try:
+            uploaded_file = await loop.run_in_executor(_UPLOAD_EXECUTOR, _upload)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        _CACHE[digest] = (time.time(), uploaded_file)
+        return uploaded_file
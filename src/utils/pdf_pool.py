@@ -0,0 +1,64 @@
+"""
+Shared process pool for CPU-heavy PDF parsing.
+Running extraction in worker processes lets several PDFs parse in parallel instead of
+contending for the GIL in the default thread pool.
+"""
+
+import os
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+from src.logging import logger
+
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the shared PDF process pool, starting it on first use."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                workers = min(4, os.cpu_count() or 1)
+                # Spawn rather than fork: the app process runs threads (Gradio, executors)
+                _POOL = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.debug(f"🔧 Started PDF process pool with {workers} workers")
+    return _POOL
+
+
+def _reset_pdf_pool(broken: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is broken:
+            _POOL = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_pdf_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a picklable module-level function in the PDF process pool.
+
+    Args:
+        fn: Function to run (must be importable by the worker processes)
+        *args: Picklable arguments for the function
+
+    Returns:
+        The function's return value
+    """
+    pool = get_pdf_pool()
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        logger.warning("⚠️  PDF process pool broke, it will be restarted on the next call")
+        _reset_pdf_pool(pool)
+        raise
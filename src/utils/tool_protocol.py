@@ -0,0 +1,22 @@
+"""
+Call signature shared by every tool function.
+Kept free of imports from src.tools and the registry so either side can use
+it without creating an import cycle.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Awaitable, Protocol
+
+if TYPE_CHECKING:
+    from src.providers.base import BaseLLMProvider
+
+
+class ToolFunction(Protocol):
+    """An async tool: positional inputs plus the keyword-only LLM provider, returning text for the LLM."""
+
+    def __call__(self, *args: Any, provider: BaseLLMProvider, **kwargs: Any) -> Awaitable[str]:
+        ...
+
+
+__all__ = ["ToolFunction"]
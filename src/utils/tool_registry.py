@@ -2,205 +2,507 @@
 Tool registry and declarations for function calling.
 Maps tool names to their implementations and defines schemas.
 Supports both sync (legacy) and async (new) function maps.
+
+Every tool is declared once in TOOL_SPECS; the Gemini declarations, the flat
+schema list, the function maps and the MCP schemas are all projections of it.
 """
 
-from typing import Dict, Callable, List, TYPE_CHECKING
+from __future__ import annotations
+
+import functools
+import importlib
+import sys
+import threading
+from dataclasses import dataclass
+from collections.abc import Mapping
+from enum import IntEnum
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+from src.config import EAGER_TOOLS
 
-# Use lazy imports to avoid circular dependency
+# Annotations are never evaluated at runtime, so these are only imported for type checkers
 if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
     from src.providers.base import BaseLLMProvider
+    from src.utils.tool_protocol import ToolFunction
 
 
-# Define tool declarations for Gemini (legacy format)
-tools = [
-    {
-        "function_declarations": [
-            {
-                "name": "retrieve_related_papers",
-                "description": "Retrieve up to 5 recent arXiv papers matching the query. Uses LLM-refined queries and intelligent ranking.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The search query for arXiv papers",
-                        }
-                    },
-                    "required": ["query"],
-                },
-            },
-            {
-                "name": "explain_research_paper",
-                "description": "Explain a research paper in clear, non-technical language (Modern Standard Arabic with technical terms in English). Generates 500-600 word summaries with pros/cons tables.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "paper_info": {
-                            "type": "string",
-                            "description": "The research paper information to explain",
-                        }
-                    },
-                    "required": ["paper_info"],
-                },
-            },
-            {
-                "name": "write_social_media_post",
-                "description": "Create a social-media-friendly post (Arabic with Egyptian dialect) summarizing the paper. 200-300 words with multi-step generation.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "explanation": {
-                            "type": "string",
-                            "description": "The explanation to convert into a social media post",
-                        }
-                    },
-                    "required": ["explanation"],
-                },
-            },
-            {
-                "name": "process_uploaded_pdf",
-                "description": "Process and analyze an uploaded PDF research paper. Extracts text and provides structured summary.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "pdf_path": {
-                            "type": "string",
-                            "description": "The file path to the uploaded PDF",
-                        }
-                    },
-                    "required": ["pdf_path"],
-                },
-            },
-            {
-                "name": "generate_paper_infographic",
-                "description": "Generate a beautiful academic infographic visualization from a research paper summary. Creates a visually stunning image perfect for social media sharing and presentations with 10 structured sections.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "paper_info": {
-                            "type": "string",
-                            "description": "The research paper information or summary to visualize as an infographic",
-                        }
-                    },
-                    "required": ["paper_info"],
-                },
+@dataclass(frozen=True)
+class ToolSpec:
+    """
+    Declaration of one tool available to the LLM.
+
+    Attributes:
+        name: Tool name, also the function's name in its module
+        module: Module defining the tool function
+        description: Description shown to the LLM
+        properties: JSON schema of each parameter
+        required: Names of the required parameters
+    """
+    name: str
+    module: str
+    description: str
+    properties: Dict[str, Any]
+    required: List[str]
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """JSON schema of the tool's parameters object."""
+        return {
+            "type": "object",
+            "properties": self.properties,
+            "required": self.required,
+        }
+
+    def as_gemini(self) -> Dict[str, Any]:
+        """Function declaration in Gemini's format."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "parameters": self.parameters,
+        }
+
+    def as_mcp(self) -> Dict[str, Any]:
+        """Tool schema in MCP's format (also Anthropic's tool format)."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.parameters,
+        }
+
+    def as_openai(self) -> Dict[str, Any]:
+        """Tool definition in OpenAI's chat completions format."""
+        return {"type": "function", "function": self.as_gemini()}
+
+
+TOOL_SPECS: List[ToolSpec] = [
+    ToolSpec(
+        name="retrieve_related_papers",
+        module="src.tools.arxiv_search",
+        description="Retrieve up to 5 recent arXiv papers matching the query. Uses LLM-refined queries and intelligent ranking.",
+        properties={
+            "query": {
+                "type": "string",
+                "description": "The search query for arXiv papers"
+            }
+        },
+        required=["query"],
+    ),
+    ToolSpec(
+        name="explain_research_paper",
+        module="src.tools.explainer",
+        description="Explain a research paper in clear, non-technical language (Modern Standard Arabic with technical terms in English). Generates 500-600 word summaries with pros/cons tables.",
+        properties={
+            "paper_info": {
+                "type": "string",
+                "description": "The research paper information to explain"
+            }
+        },
+        required=["paper_info"],
+    ),
+    ToolSpec(
+        name="write_social_media_post",
+        module="src.tools.social_post",
+        description="Create a social-media-friendly post (Arabic with Egyptian dialect) summarizing the paper. 200-300 words with multi-step generation.",
+        properties={
+            "explanation": {
+                "type": "string",
+                "description": "The explanation to convert into a social media post"
+            }
+        },
+        required=["explanation"],
+    ),
+    ToolSpec(
+        name="process_uploaded_pdf",
+        module="src.tools.pdf_processor",
+        description="Process and analyze an uploaded PDF research paper. Extracts text and provides structured summary.",
+        properties={
+            "pdf_path": {
+                "type": "string",
+                "description": "The file path to the uploaded PDF"
+            }
+        },
+        required=["pdf_path"],
+    ),
+    ToolSpec(
+        name="generate_paper_infographic",
+        module="src.tools.infographic_generator",
+        description="Generate a beautiful academic infographic visualization from a research paper summary. Creates a visually stunning image perfect for social media sharing and presentations with 10 structured sections.",
+        properties={
+            "paper_info": {
+                "type": "string",
+                "description": "The research paper information or summary to visualize as an infographic"
+            }
+        },
+        required=["paper_info"],
+    ),
+    ToolSpec(
+        name="verify_document_sources",
+        module="src.tools.source_verifier",
+        description="Perform advanced source verification on a research document. Validates references against academic databases (Semantic Scholar, CrossRef), extracts and fact-checks verifiable claims, and detects potential issues like hallucinated citations or unsubstantiated claims. Returns a comprehensive verification report.",
+        properties={
+            "document_text": {
+                "type": "string",
+                "description": "The full document text to verify (research paper, article, report, etc.)"
             },
-            {
-                "name": "verify_document_sources",
-                "description": "Perform advanced source verification on a research document. Validates references against academic databases (Semantic Scholar, CrossRef), extracts and fact-checks verifiable claims, and detects potential issues like hallucinated citations or unsubstantiated claims. Returns a comprehensive verification report.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "document_text": {
-                            "type": "string",
-                            "description": "The full document text to verify (research paper, article, report, etc.)",
-                        },
-                        "verify_claims": {
-                            "type": "boolean",
-                            "description": "Whether to extract and verify claims (default: true)",
-                        },
-                        "verify_references": {
-                            "type": "boolean",
-                            "description": "Whether to validate references and citations (default: true)",
-                        }
-                    },
-                    "required": ["document_text"],
-                },
+            "verify_claims": {
+                "type": "boolean",
+                "description": "Whether to extract and verify claims (default: true)"
             },
-            {
-                "name": "recommend_similar_papers",
-                "description": "Recommend similar research papers based on a given paper's DOI, arXiv ID, title, or content. Uses Semantic Scholar's recommendation engine to find contextually similar papers that may be relevant for literature review.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "paper_info": {
-                            "type": "string",
-                            "description": "Paper information: DOI (e.g., '10.xxxx/xxxx'), arXiv ID (e.g., 'arXiv:2101.12345'), paper title, or paper content/abstract",
-                        },
-                        "num_recommendations": {
-                            "type": "integer",
-                            "description": "Number of similar papers to recommend (default: 10, max: 20)",
-                        }
-                    },
-                    "required": ["paper_info"],
-                },
+            "verify_references": {
+                "type": "boolean",
+                "description": "Whether to validate references and citations (default: true)"
+            }
+        },
+        required=["document_text"],
+    ),
+    ToolSpec(
+        name="recommend_similar_papers",
+        module="src.tools.paper_recommender",
+        description="Recommend similar research papers based on a given paper's DOI, arXiv ID, title, or content. Uses Semantic Scholar's recommendation engine to find contextually similar papers that may be relevant for literature review.",
+        properties={
+            "paper_info": {
+                "type": "string",
+                "description": "Paper information: DOI (e.g., '10.xxxx/xxxx'), arXiv ID (e.g., 'arXiv:2101.12345'), paper title, or paper content/abstract"
             },
-        ]
-    }
+            "num_recommendations": {
+                "type": "integer",
+                "description": "Number of similar papers to recommend (default: 10, max: 20)"
+            }
+        },
+        required=["paper_info"],
+    ),
 ]
 
 
-def _get_tools():
-    """Lazy import tools to avoid circular dependency."""
-    from src.tools import (
-        retrieve_related_papers,
-        explain_research_paper,
-        write_social_media_post,
-        process_uploaded_pdf,
-        generate_paper_infographic,
-        verify_document_sources,
-        recommend_similar_papers,
-    )
-    return {
-        "retrieve_related_papers": retrieve_related_papers,
-        "explain_research_paper": explain_research_paper,
-        "write_social_media_post": write_social_media_post,
-        "process_uploaded_pdf": process_uploaded_pdf,
-        "generate_paper_infographic": generate_paper_infographic,
-        "verify_document_sources": verify_document_sources,
-        "recommend_similar_papers": recommend_similar_papers,
-    }
-
-
-# Legacy synchronous function map (for backward compatibility)
-# This will be populated on first access
-_function_map = None
-
-
-def get_function_map():
-    """Get the function map, loading tools lazily."""
-    global _function_map
-    if _function_map is None:
-        _function_map = _get_tools()
+# JSON schema keywords that recur in every declaration
+_SCHEMA_WORDS = frozenset({"object", "string", "boolean", "integer", "number", "array"})
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively make a schema read-only: dicts become MappingProxyType and
+    lists become tuples. Keys and schema type names are interned so every
+    declaration shares the same string objects.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str) and value in _SCHEMA_WORDS:
+        return sys.intern(value)
+    return value
+
+
+@functools.cache
+def _gemini_tools() -> List[Dict[str, Any]]:
+    """
+    Tool declarations for Gemini (legacy format), built on first use.
+
+    Kept as plain dicts and lists: genai only accepts real dict/list
+    declarations and would iterate a MappingProxyType as its keys.
+    """
+    return [{"function_declarations": [spec.as_gemini() for spec in TOOL_SPECS]}]
+
+
+@functools.cache
+def _frozen_schemas() -> Tuple[Mapping[str, Any], ...]:
+    """Flat tool declarations, built on first use and shared read-only."""
+    return _freeze([spec.as_gemini() for spec in TOOL_SPECS])
+
+
+_SPECS_BY_NAME: Dict[str, ToolSpec] = {spec.name: spec for spec in TOOL_SPECS}
+
+# Tool functions resolved so far, by name
+_resolved_tools: Dict[str, ToolFunction] = {}
+# Serializes first-time resolution when requests race on a cold start
+_resolve_lock = threading.Lock()
+
+
+def _resolve_tool(name: str) -> ToolFunction:
+    """Import a single tool's module on first use and return its function."""
+    tool = _resolved_tools.get(name)
+    if tool is None:
+        spec = _SPECS_BY_NAME[name]
+        with _resolve_lock:
+            # Another thread may have resolved it while we waited
+            tool = _resolved_tools.get(name)
+            if tool is None:
+                # Import the tool's own module directly rather than through the src.tools package
+                tool = _resolved_tools[name] = getattr(importlib.import_module(spec.module), name)
+                # Later calls through the async map can skip _call_tool and go straight to the tool
+                cached = _last_async_function_map
+                if cached is not None:
+                    cached[1][name] = functools.partial(tool, provider=cached[0])
+    return tool
+
+
+def _call_tool(name: str, *args, **kwargs):
+    """Call a tool by name, importing it on the first call."""
+    return _resolve_tool(name)(*args, **kwargs)
+
+
+def _bind_provider(name: str, provider: BaseLLMProvider) -> Callable:
+    """Bind the provider to a tool, through _call_tool if the tool is not imported yet."""
+    tool = _resolved_tools.get(name)
+    if tool is not None:
+        return functools.partial(tool, provider=provider)
+    return functools.partial(_call_tool, name, provider=provider)
+
+
+class _LazyToolMap(Mapping):
+    """Read-only mapping of tool name to function that imports each tool when looked up."""
+
+    def __getitem__(self, name: str) -> ToolFunction:
+        return _resolve_tool(name)
+
+    def __contains__(self, name: object) -> bool:
+        # Membership checks must not import the tool
+        return name in _SPECS_BY_NAME
+
+    def __iter__(self):
+        return (spec.name for spec in TOOL_SPECS)
+
+    def __len__(self) -> int:
+        return len(TOOL_SPECS)
+
+
+# Legacy synchronous function map (for backward compatibility). Built once at
+# import, so there is no first-call initialization for callers to race on.
+_function_map = _LazyToolMap()
+
+
+def get_function_map() -> Mapping[str, ToolFunction]:
+    """Get the function map; tools are imported as they are looked up."""
     return _function_map
 
 
-# For backward compatibility, expose as a property
-@property
-def function_map():
-    return get_function_map()
+# Position of each tool in TOOL_SPECS (e.g. ToolId.VERIFY_DOCUMENT_SOURCES), for
+# dispatching by index instead of by name. Derived from the specs, so reordering
+# or replacing a spec can never point an id at the wrong tool.
+ToolId = IntEnum("ToolId", {spec.name.upper(): i for i, spec in enumerate(TOOL_SPECS)})
+
+# Translates a tool name (e.g. one returned by the LLM) once, at the boundary
+NAME_TO_ID: Mapping[str, ToolId] = MappingProxyType({spec.name: ToolId[spec.name.upper()] for spec in TOOL_SPECS})
+
+# Tool functions by ToolId, filled in as each tool is first dispatched
+_dispatch_table: List[Optional[ToolFunction]] = [None] * len(TOOL_SPECS)
+
+
+def dispatch(tool_id: int, *args, **kwargs):
+    """
+    Call a tool by its ToolId, importing it on the first call.
+    
+    Args:
+        tool_id: ToolId (or its int value) of the tool to call
+        *args, **kwargs: Arguments for the tool, including provider=
+        
+    Returns:
+        Whatever the tool returns (a coroutine for the async tools)
+    """
+    tool = _dispatch_table[tool_id]
+    if tool is None:
+        tool = _dispatch_table[tool_id] = _resolve_tool(TOOL_SPECS[tool_id].name)
+    return tool(*args, **kwargs)
+
+
+def __getattr__(name):
+    # For backward compatibility, expose tools, function_map and the tool functions
+    if name == "tools":
+        return _gemini_tools()
+    if name == "function_map":
+        return get_function_map()
+    if name in _SPECS_BY_NAME:
+        return _resolve_tool(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def get_async_function_map(provider: 'BaseLLMProvider') -> Dict[str, Callable]:
+# Last async function map built and its provider. The map's partials hold the
+# provider, so a weak-keyed cache could never drop it; the app uses a single
+# shared provider, so remembering the last one is enough.
+_last_async_function_map: Optional[Tuple[BaseLLMProvider, Dict[str, Callable]]] = None
+_async_map_lock = threading.Lock()
+
+
+def get_async_function_map(provider: BaseLLMProvider) -> Dict[str, Callable]:
     """
     Get async function map with provider injected.
     
+    Every tool takes the provider as its keyword-only `provider` argument, so
+    each entry is a partial binding it. The map is reused while the provider
+    stays the same, and tools are not imported here; each is imported the
+    first time it is called, after which its entry calls the tool directly.
+    
     Args:
         provider: LLM provider instance to inject into tools
         
     Returns:
         Dictionary mapping function names to async callables
     """
-    tools_dict = _get_tools()
+    global _last_async_function_map
+    cached = _last_async_function_map
+    if cached is not None and cached[0] is provider:
+        return cached[1]
+    with _async_map_lock:
+        cached = _last_async_function_map
+        if cached is None or cached[0] is not provider:
+            function_map = {spec.name: _bind_provider(spec.name, provider) for spec in TOOL_SPECS}
+            cached = _last_async_function_map = (provider, function_map)
+    return cached[1]
+
+
+def get_tool_schemas() -> Tuple[Mapping[str, Any], ...]:
+    """
+    Get tool schemas in a flat list format, for reading only.
     
-    return {
-        "retrieve_related_papers": lambda query: tools_dict["retrieve_related_papers"](query, provider),
-        "explain_research_paper": lambda paper_info: tools_dict["explain_research_paper"](paper_info, provider),
-        "write_social_media_post": lambda explanation: tools_dict["write_social_media_post"](explanation, provider),
-        "process_uploaded_pdf": lambda pdf_path: tools_dict["process_uploaded_pdf"](pdf_path, provider),
-        "generate_paper_infographic": lambda paper_info: tools_dict["generate_paper_infographic"](paper_info, provider),
-        "verify_document_sources": lambda document_text, verify_claims=True, verify_references=True: 
-            tools_dict["verify_document_sources"](document_text, provider, verify_claims, verify_references),
-        "recommend_similar_papers": lambda paper_info, num_recommendations=10: 
-            tools_dict["recommend_similar_papers"](paper_info, num_recommendations),
-    }
-
-
-def get_tool_schemas() -> List[Dict]:
-    """
-    Get tool schemas in a flat list format.
+    The schemas are shared, so they are frozen: mutating them raises
+    TypeError instead of changing what every other caller sees. genai cannot
+    consume this view (it needs real dicts and lists), so never pass it to
+    the SDK; use `tools` or build from TOOL_SPECS (ToolSpec.parameters
+    returns plain dicts) instead.
     
     Returns:
-        List of tool schema dictionaries
+        Tuple of read-only tool schema mappings
     """
-    return tools[0]["function_declarations"]
+    return _frozen_schemas()
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+@functools.cache
+def get_tool_schemas_json() -> bytes:
+    """
+    Get the flat tool schema list as JSON, serialized once on first use.
+    
+    Returns:
+        UTF-8 JSON bytes of the schemas returned by get_tool_schemas()
+    """
+    return _dumps([spec.as_gemini() for spec in TOOL_SPECS])
+
+
+@functools.cache
+def get_schemas_for(provider_name: Literal["gemini", "openai", "anthropic"]) -> bytes:
+    """
+    Get the tool list in a provider's request format, serialized once per provider.
+    
+    Adapters that build request bodies themselves can splice these bytes in
+    as the "tools" value instead of re-serializing the schemas every request.
+    
+    Args:
+        provider_name: "gemini", "openai" or "anthropic"
+        
+    Returns:
+        UTF-8 JSON bytes of the provider's "tools" value
+        
+    Raises:
+        ValueError: If the provider is not supported
+    """
+    if provider_name == "gemini":
+        return _dumps([{"function_declarations": [spec.as_gemini() for spec in TOOL_SPECS]}])
+    if provider_name == "openai":
+        return _dumps([spec.as_openai() for spec in TOOL_SPECS])
+    if provider_name == "anthropic":
+        return _dumps([spec.as_mcp() for spec in TOOL_SPECS])
+    raise ValueError(f"Unsupported provider for tool schemas: {provider_name}")
+
+
+def load_all_tools() -> None:
+    """Import every tool now instead of on its first call."""
+    for spec in TOOL_SPECS:
+        _resolve_tool(spec.name)
+
+
+# Eager mode (RA_EAGER_TOOLS=1) makes a tool that fails to import break startup
+# instead of its first call. Nothing a tool imports loads this registry (src.utils
+# exposes it lazily), so a tool is never imported here while half-initialized.
+if EAGER_TOOLS:
+    load_all_tools()
+
+
+__all__ = [
+    "ToolSpec",
+    "TOOL_SPECS",
+    "tools",
+    "function_map",
+    "get_function_map",
+    "ToolId",
+    "NAME_TO_ID",
+    "dispatch",
+    "load_all_tools",
+    "get_async_function_map",
+    "get_tool_schemas",
+    "get_tool_schemas_json",
+    "get_schemas_for",
+]
+
+
+def _bench_imports(max_ms: Optional[float] = None) -> int:
+    """
+    Print the cold import time of each tool module, each measured in a fresh interpreter.
+    
+    Args:
+        max_ms: Fail if the summed import time exceeds this many milliseconds
+        
+    Returns:
+        Process exit code: 1 if a module failed to import or max_ms was exceeded
+    """
+    import subprocess
+
+    total_ms = 0.0
+    failed = False
+    for spec in TOOL_SPECS:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {spec.module}"],
+            capture_output=True, text=True,
+        )
+        # -X importtime lines: "import time: <self us> | <cumulative us> | <indented module>"
+        cumulative_us = None
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if line.startswith("import time:") and len(parts) == 3 and parts[2].strip() == spec.module:
+                cumulative_us = int(parts[1])
+        if result.returncode != 0 or cumulative_us is None:
+            print(f"❌ {spec.name:<28} {spec.module}: import failed")
+            failed = True
+            continue
+        total_ms += cumulative_us / 1000
+        print(f"⏱️ {spec.name:<28} {cumulative_us / 1000:9.1f} ms  {spec.module}")
+
+    print(f"Total: {total_ms:.1f} ms")
+    if max_ms is not None and total_ms > max_ms:
+        print(f"❌ Import time exceeds the {max_ms:.1f} ms limit")
+        return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tool registry utilities")
+    parser.add_argument(
+        "--bench-import",
+        action="store_true",
+        help="Measure the cold import time of each tool module"
+    )
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="With --bench-import, exit with status 1 if the total exceeds this many milliseconds"
+    )
+    args = parser.parse_args()
+    if args.bench_import:
+        sys.exit(_bench_imports(args.max_ms))
+    parser.print_help()